@@ -6,6 +6,7 @@ Chat and RAG endpoints with streaming support.
 
 from typing import Annotated
 
+import msgspec
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
@@ -17,6 +18,14 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+# Shared encoder for SSE events (faster than json.dumps per token)
+_sse_encoder = msgspec.json.Encoder()
+
+
+def _sse_event(event: dict) -> bytes:
+    """Encode an event as a Server-Sent Events frame."""
+    return b"data: " + _sse_encoder.encode(event) + b"\n\n"
+
 
 # =============================================================================
 # Request/Response Models
@@ -117,7 +126,6 @@ async def chat_stream(
     - Source citations at the end
     - Metadata (tokens, latency)
     """
-    import json
     from app.rag import get_rag_pipeline
     
     async def generate():
@@ -132,7 +140,7 @@ async def chat_stream(
                 filters=None,
             ):
                 # Convert event to SSE format
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _sse_event(event)
                 
         except Exception as e:
             logger.error(
@@ -141,7 +149,7 @@ async def chat_stream(
                 error=str(e),
             )
             error_event = {"type": "error", "error": str(e)}
-            yield f"data: {json.dumps(error_event)}\n\n"
+            yield _sse_event(error_event)
     
     logger.info(
         "Chat stream request",
@@ -4,7 +4,10 @@ AI Stack FastAPI - Structured Logging
 Production-ready logging configuration using structlog.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Any
 
@@ -13,22 +16,59 @@ from structlog.types import Processor
 
 from app.core.config import settings
 
+# Background thread that renders and writes queued log records
+_listener: logging.handlers.QueueListener | None = None
+
+
+class _EnqueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that enqueues records untouched.
+    
+    The default QueueHandler.prepare() formats the record on the calling
+    thread; skipping it leaves rendering to the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _capture_exc_info(
+    logger: Any, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Resolve exc_info=True to the active exception on the calling thread.
+    
+    The listener thread has no active exception, so a bare True would
+    render without a traceback there.
+    """
+    exc_info = event_dict.get("exc_info")
+    if exc_info and not isinstance(exc_info, (tuple, BaseException)):
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def _stop_listener() -> None:
+    """Flush and stop the log listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging() -> None:
     """
     Configure structured logging for the application.
     Uses JSON format in production, pretty console output in development.
+    
+    Log calls only run the cheap shared processors and enqueue the record;
+    rendering (JSON encoding) and stdout I/O happen on a QueueListener
+    thread, off the event loop.
     """
+    global _listener
+    
     # Determine log level based on environment
     log_level = logging.DEBUG if settings.DEBUG else logging.INFO
     
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=log_level,
-    )
-    
     # Shared processors
     shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
@@ -41,25 +81,51 @@ def setup_logging() -> None:
     ]
     
     if settings.APP_ENV == "production":
-        # JSON logging for production (log aggregation)
-        processors: list[Processor] = [
-            *shared_processors,
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ]
+        # JSON logging for production (log aggregation); tracebacks are
+        # formatted before the record leaves the calling thread
+        shared_processors.append(structlog.processors.format_exc_info)
+        renderer: Processor = structlog.processors.JSONRenderer()
     else:
         # Pretty console output for development
-        processors = [
-            *shared_processors,
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+        shared_processors.append(_capture_exc_info)
+        renderer = structlog.dev.ConsoleRenderer(colors=True)
+    
+    # Output handler, driven by the listener thread
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=shared_processors,
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                renderer,
+            ],
+        )
+    )
+    
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    
+    if _listener is None:
+        atexit.register(_stop_listener)
+    else:
+        _listener.stop()
+    _listener = logging.handlers.QueueListener(log_queue, handler)
+    _listener.start()
+    
+    # Configure standard library logging
+    root_logger = logging.getLogger()
+    root_logger.handlers = [_EnqueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
     
     # Configure structlog
     structlog.configure(
-        processors=processors,
+        processors=[
+            *shared_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        # Drops calls below log_level before any processor runs
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
@@ -12,6 +12,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
 
+from ai_core.llm import close_llm_clients
 from app.api.v1 import router as api_v1_router
 from app.core.config import settings
 from app.core.database import init_db, close_db
@@ -19,6 +20,7 @@ from app.core.logging import setup_logging
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.error_handler import error_handler_middleware
 from app.middleware.auth import AuthMiddleware
+from vector_db import aclose_all as close_vector_stores
 
 # Initialize structured logging
 setup_logging()
@@ -42,8 +44,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     logger.info("Shutting down AI Stack FastAPI application")
+    from app.rag import close_rag_pipeline  # Imported lazily, as in the API routes
+    await close_rag_pipeline()
+    logger.info("RAG pipeline closed")
     await close_db()
     logger.info("Database connections closed")
+    await close_llm_clients()
+    logger.info("LLM clients closed")
+    await close_vector_stores()
+    logger.info("Vector store connections closed")
 
 
 def create_application() -> FastAPI:
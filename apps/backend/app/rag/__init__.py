@@ -4,7 +4,13 @@ AI Stack - RAG Package
 Retrieval-Augmented Generation pipeline.
 """
 
-from app.rag.pipeline import RAGPipeline, RAGConfig, RAGResponse, get_rag_pipeline
+from app.rag.pipeline import (
+    RAGPipeline,
+    RAGConfig,
+    RAGResponse,
+    get_rag_pipeline,
+    close_rag_pipeline,
+)
 from app.rag.document_processor import DocumentProcessor, DocumentChunk, create_document_id
 
 __all__ = [
@@ -12,6 +18,7 @@ __all__ = [
     "RAGConfig",
     "RAGResponse",
     "get_rag_pipeline",
+    "close_rag_pipeline",
     "DocumentProcessor",
     "DocumentChunk",
     "create_document_id",
@@ -12,12 +12,15 @@ Components:
 6. LLM generation with streaming
 """
 
+import asyncio
+import logging
 from typing import AsyncIterator
 import time
 from datetime import datetime, UTC
 
+import msgspec
+import numpy as np
 import structlog
-from pydantic import BaseModel, Field
 
 # Import our packages
 from ai_core import get_llm_client, LLMClient, LLMMessage, LLMRole
@@ -26,24 +29,135 @@ from vector_db import get_vector_store, VectorStore, SearchResult, VectorMetadat
 logger = structlog.get_logger(__name__)
 
 
-class RAGConfig(BaseModel):
-    """RAG pipeline configuration."""
-    max_context_tokens: int = Field(default=4000, description="Max tokens for context")
-    top_k: int = Field(default=10, description="Number of chunks to retrieve")
-    min_similarity: float = Field(default=0.7, description="Minimum similarity score")
-    chunk_size: int = Field(default=1000, description="Chunk size for documents")
-    chunk_overlap: int = Field(default=200, description="Overlap between chunks")
+class RAGConfig(msgspec.Struct, frozen=True):
+    """
+    RAG pipeline configuration.
+    
+    Frozen (and therefore hashable) so it can be shared across requests
+    and used as part of a cache key.
+    """
+    max_context_tokens: int = 4000  # Max tokens for context
+    top_k: int = 10  # Number of chunks to retrieve
+    min_similarity: float = 0.7  # Minimum similarity score
+    chunk_size: int = 1000  # Chunk size for documents
+    chunk_overlap: int = 200  # Overlap between chunks
+    embed_batch_size: int = 32  # Max queries per batched embedding call
+    embed_batch_hold_ms: float = 10.0  # Time to wait for a batch to fill
 
 
-class RAGResponse(BaseModel):
+class RAGResponse(msgspec.Struct, gc=False):
     """RAG query response."""
     answer: str
-    sources: list[str] = Field(default_factory=list)
-    source_texts: list[str] = Field(default_factory=list)
+    sources: list[str] = msgspec.field(default_factory=list)
+    source_texts: list[str] = msgspec.field(default_factory=list)
     tokens_used: int = 0
     cost: float = 0.0
     latency_ms: float = 0.0
     context_chunks: int = 0
+    
+    def model_dump(self) -> dict:
+        """Pydantic-compatible dict conversion."""
+        return msgspec.structs.asdict(self)
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent query embeddings into a single provider call.
+    
+    Each request submits its text and awaits a future; a background task
+    waits `max_hold_s` for more requests to arrive, then embeds up to
+    `max_batch_size` texts in one `llm.embed()` call and resolves each future
+    with its row.
+    """
+    
+    def __init__(
+        self,
+        llm: LLMClient,
+        max_batch_size: int = 32,
+        max_hold_s: float = 0.01,
+    ):
+        self.llm = llm
+        self.max_batch_size = max_batch_size
+        self.max_hold_s = max_hold_s
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] | None = None
+        self._worker: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+    
+    async def submit(self, text: str) -> asyncio.Future:
+        """Queue text for embedding and return a future for its vector."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return future
+    
+    async def _run(self) -> None:
+        """Collect queued texts into batches and dispatch them."""
+        batch: list[tuple[str, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                await asyncio.sleep(self.max_hold_s)
+                
+                while len(batch) < self.max_batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                
+                # Dispatch without blocking collection of the next batch
+                task = asyncio.create_task(self._flush(batch))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+                batch = []
+        finally:
+            # Stopped (closed or cancelled): nothing will embed what's left
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            _fail(batch, RuntimeError("Embedding batcher closed"))
+    
+    async def _flush(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch and resolve its futures."""
+        try:
+            vectors = await self.llm.embed([text for text, _ in batch])
+        except Exception as e:
+            _fail(batch, e)
+            return
+        except BaseException:
+            _fail(batch, RuntimeError("Embedding batch cancelled"))
+            raise
+        
+        if len(vectors) != len(batch):
+            _fail(batch, RuntimeError(
+                f"Embedding provider returned {len(vectors)} vectors for {len(batch)} texts"
+            ))
+            return
+        
+        for (_, future), vector in zip(batch, vectors, strict=True):
+            if not future.done():
+                future.set_result(vector)
+        
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Embedding batch flushed", batch_size=len(batch))
+    
+    async def close(self) -> None:
+        """Stop the background worker, failing queued requests, and finish in-flight batches."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+            # A worker cancelled before its first step never ran its cleanup
+            queued = []
+            while not self._queue.empty():
+                queued.append(self._queue.get_nowait())
+            _fail(queued, RuntimeError("Embedding batcher closed"))
+        await asyncio.gather(*self._inflight, return_exceptions=True)
+
+
+def _fail(batch: list[tuple[str, asyncio.Future]], error: BaseException) -> None:
+    """Resolve every unresolved future in a batch with an error."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(error)
 
 
 class RAGPipeline:
@@ -74,6 +188,11 @@ class RAGPipeline:
         self.llm = llm_client or get_llm_client()
         self.vector_store = vector_store or get_vector_store()
         self.config = config or RAGConfig()
+        self.embedder = EmbeddingBatcher(
+            self.llm,
+            max_batch_size=self.config.embed_batch_size,
+            max_hold_s=self.config.embed_batch_hold_ms / 1000,
+        )
         
         logger.info(
             "RAG pipeline initialized",
@@ -82,6 +201,10 @@ class RAGPipeline:
             max_context_tokens=self.config.max_context_tokens,
         )
     
+    async def close(self) -> None:
+        """Stop the embedding batcher (the shared LLM client and store stay open)."""
+        await self.embedder.close()
+    
     async def query(
         self,
         question: str,
@@ -117,19 +240,24 @@ class RAGPipeline:
             question_length=len(question),
         )
         
+        # Resolve once so disabled debug calls don't build their kwargs
+        debug = logger.is_enabled_for(logging.DEBUG)
+        
         try:
             # Step 1: Generate embedding for question
-            logger.debug("Generating query embedding")
-            query_embedding = await self.llm.embed(question)
+            if debug:
+                logger.debug("Generating query embedding")
+            query_embedding = await self._embed_query(question)
             
             # Step 2: Search vector store
-            logger.debug(
-                "Searching vector store",
-                top_k=self.config.top_k,
-                has_filters=filters is not None,
-            )
+            if debug:
+                logger.debug(
+                    "Searching vector store",
+                    top_k=self.config.top_k,
+                    has_filters=filters is not None,
+                )
             search_results = await self.vector_store.search(
-                query_vector=query_embedding[0],  # First embedding
+                query_vector=query_embedding,
                 top_k=self.config.top_k,
                 filters=filters,
             )
@@ -140,17 +268,19 @@ class RAGPipeline:
                 if r.score >= self.config.min_similarity
             ]
             
-            logger.debug(
-                "Search completed",
-                results_found=len(search_results),
-                after_filtering=len(filtered_results),
-            )
+            if debug:
+                logger.debug(
+                    "Search completed",
+                    results_found=len(search_results),
+                    after_filtering=len(filtered_results),
+                )
             
             # Step 4: Build context from results
             context = self._build_context(filtered_results)
             
             # Step 5: Generate answer
-            logger.debug("Generating answer with LLM")
+            if debug:
+                logger.debug("Generating answer with LLM")
             prompt = self._build_prompt(question, context, conversation_history)
             
             llm_response = await self.llm.complete(
@@ -216,9 +346,9 @@ class RAGPipeline:
         
         try:
             # Retrieval phase (same as non-streaming)
-            query_embedding = await self.llm.embed(question)
+            query_embedding = await self._embed_query(question)
             search_results = await self.vector_store.search(
-                query_vector=query_embedding[0],
+                query_vector=query_embedding,
                 top_k=self.config.top_k,
                 filters=filters,
             )
@@ -286,34 +416,41 @@ class RAGPipeline:
                 "error": str(e),
             }
     
+    async def _embed_query(self, question: str) -> list[float]:
+        """Embed a question via the shared micro-batcher."""
+        future = await self.embedder.submit(question)
+        return await future
+    
     def _build_context(self, results: list[SearchResult]) -> str:
         """
         Build context string from search results.
         
         Respects max_context_tokens limit.
         """
-        parts = []
-        token_count = 0
+        if not results:
+            return ""
         
-        for i, result in enumerate(results):
-            # Format: [Source {i+1}]\n{text}\n
-            text = f"[Source {i+1}]\n{result.text}\n"
-            
-            # Rough token estimate (4 chars ≈ 1 token)
-            tokens = len(text) // 4
-            
-            if token_count + tokens > self.config.max_context_tokens:
-                logger.debug(
-                    "Context token limit reached",
-                    used_sources=i,
-                    total_sources=len(results),
-                )
-                break
-            
-            parts.append(text)
-            token_count += tokens
+        # Format: [Source {i+1}]\n{text}\n
+        parts = [f"[Source {i+1}]\n{result.text}\n" for i, result in enumerate(results)]
+        
+        # Rough token estimate (4 UTF-8 bytes ≈ 1 token), truncated on the
+        # running total in one vectorized pass
+        sizes = np.fromiter(
+            (len(part.encode("utf-8")) for part in parts),
+            dtype=np.int64,
+            count=len(parts),
+        )
+        totals = np.cumsum(sizes // 4)
+        used = int(np.searchsorted(totals, self.config.max_context_tokens, side="right"))
         
-        return "\n---\n\n".join(parts)
+        if used < len(parts) and logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Context token limit reached",
+                used_sources=used,
+                total_sources=len(results),
+            )
+        
+        return "\n---\n\n".join(parts[:used])
     
     def _build_prompt(
         self,
@@ -362,3 +499,11 @@ def get_rag_pipeline() -> RAGPipeline:
     if _rag_pipeline is None:
         _rag_pipeline = RAGPipeline()
     return _rag_pipeline
+
+
+async def close_rag_pipeline() -> None:
+    """Close the RAG pipeline singleton, if one was created."""
+    global _rag_pipeline
+    if _rag_pipeline is not None:
+        await _rag_pipeline.close()
+        _rag_pipeline = None
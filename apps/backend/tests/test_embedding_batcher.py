@@ -0,0 +1,87 @@
+"""
+Tests for the RAG pipeline's EmbeddingBatcher.
+"""
+
+import asyncio
+
+import pytest
+
+from app.rag.pipeline import EmbeddingBatcher
+
+
+class FakeLLM:
+    """Embeds each text as [len(text)] and records every embed() call."""
+    
+    def __init__(self, error: Exception | None = None, missing_rows: int = 0):
+        self.calls: list[list[str]] = []
+        self.error = error
+        self.missing_rows = missing_rows
+    
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        if self.error is not None:
+            raise self.error
+        return [[float(len(text))] for text in texts][:len(texts) - self.missing_rows]
+
+
+async def submit_all(batcher: EmbeddingBatcher, texts: list[str]) -> list:
+    futures = [await batcher.submit(text) for text in texts]
+    return await asyncio.wait_for(
+        asyncio.gather(*futures, return_exceptions=True), 5
+    )
+
+
+async def test_concurrent_queries_share_one_embed_call():
+    llm = FakeLLM()
+    batcher = EmbeddingBatcher(llm, max_batch_size=8, max_hold_s=0.05)
+    
+    results = await submit_all(batcher, ["a", "bb", "ccc"])
+    
+    assert results == [[1.0], [2.0], [3.0]]
+    assert llm.calls == [["a", "bb", "ccc"]]
+    await batcher.close()
+
+
+async def test_batches_are_capped_at_max_batch_size():
+    llm = FakeLLM()
+    batcher = EmbeddingBatcher(llm, max_batch_size=2, max_hold_s=0.05)
+    
+    results = await submit_all(batcher, ["a", "bb", "ccc"])
+    
+    assert results == [[1.0], [2.0], [3.0]]
+    assert llm.calls == [["a", "bb"], ["ccc"]]
+    await batcher.close()
+
+
+async def test_embed_error_fails_every_query_in_the_batch():
+    error = RuntimeError("provider down")
+    batcher = EmbeddingBatcher(FakeLLM(error=error), max_hold_s=0.05)
+    
+    results = await submit_all(batcher, ["a", "bb"])
+    
+    assert results == [error, error]
+    await batcher.close()
+
+
+async def test_short_embed_response_fails_the_batch():
+    batcher = EmbeddingBatcher(FakeLLM(missing_rows=1), max_hold_s=0.05)
+    
+    results = await submit_all(batcher, ["a", "bb"])
+    
+    for result in results:
+        assert isinstance(result, RuntimeError)
+        assert "1 vectors for 2 texts" in str(result)
+    await batcher.close()
+
+
+async def test_close_fails_queued_queries():
+    llm = FakeLLM()
+    batcher = EmbeddingBatcher(llm, max_hold_s=10)
+    futures = [await batcher.submit(text) for text in ["a", "bb"]]
+    
+    await asyncio.wait_for(batcher.close(), 5)
+    
+    for future in futures:
+        with pytest.raises(RuntimeError, match="batcher closed"):
+            await future
+    assert llm.calls == []
@@ -17,6 +17,7 @@ from ai_core.llm.factory import (
     get_llm_client,
     list_available_providers,
     get_provider_info,
+    close_llm_clients,
 )
 from ai_core.llm.exceptions import (
     LLMError,
@@ -39,6 +40,7 @@ __all__ = [
     "get_llm_client",
     "list_available_providers",
     "get_provider_info",
+    "close_llm_clients",
     # Exceptions
     "LLMError",
     "LLMProviderError",
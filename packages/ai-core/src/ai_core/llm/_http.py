@@ -0,0 +1,49 @@
+"""
+AI Core - Shared HTTP Pool
+==========================
+Process-wide httpx.AsyncClient shared by the HTTP-based provider clients.
+
+One pool means warmed keep-alive connections are reused across clients
+(including ones created with custom kwargs) and pool tuning lives in one place.
+
+Environment Variables:
+    OPENAI_MAX_CONNECTIONS: Pool size (default 1000)
+    OPENAI_KEEPALIVE: Idle keep-alive connections retained (default 200)
+"""
+
+import os
+
+import httpx
+
+# Sized for fan-out workloads so concurrent requests don't hit PoolTimeout
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "1000")),
+    max_keepalive_connections=int(os.getenv("OPENAI_KEEPALIVE", "200")),
+    keepalive_expiry=30,
+)
+
+# SDKs pass their own per-request timeouts; this is the fallback
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+_shared_http: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _shared_http
+    if _shared_http is None or _shared_http.is_closed:
+        # HTTP/2 multiplexes concurrent requests over one TLS connection
+        _shared_http = httpx.AsyncClient(
+            http2=True,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+        )
+    return _shared_http
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client (on application shutdown)."""
+    global _shared_http
+    if _shared_http is not None:
+        await _shared_http.aclose()
+        _shared_http = None
@@ -0,0 +1,51 @@
+"""
+AI Core - Client-side Rate Limiting
+===================================
+Token-bucket limiter for provider requests-per-minute and tokens-per-minute
+budgets, so large batch jobs pace themselves instead of hitting 429s.
+"""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Requests-per-minute / tokens-per-minute token bucket.
+
+    Buckets refill lazily from elapsed time whenever acquire() runs, so no
+    background task is needed. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rpm: float, tpm: float):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = rpm
+        self._tokens = tpm
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request costing `tokens` fits in both budgets."""
+        # A request larger than the whole bucket would otherwise wait forever
+        tokens = min(tokens, self.tpm)
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+
+                await asyncio.sleep(max(
+                    (1 - self._requests) * 60 / self.rpm,
+                    (tokens - self._tokens) * 60 / self.tpm,
+                ))
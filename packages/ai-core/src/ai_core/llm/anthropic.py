@@ -16,6 +16,7 @@ from typing import AsyncIterator
 from anthropic import AsyncAnthropic
 from anthropic.types import Message, MessageStreamEvent
 
+from ai_core.llm._http import get_http_client
 from ai_core.llm.base import (
     LLMClient,
     LLMProvider,
@@ -57,7 +58,7 @@ class AnthropicClient(LLMClient):
     ):
         super().__init__(api_key=api_key, model=model, **kwargs)
         
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = AsyncAnthropic(api_key=api_key, http_client=get_http_client())
         
         logger.info("Anthropic client initialized", model=model)
     
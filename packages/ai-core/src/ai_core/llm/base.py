@@ -11,12 +11,28 @@ Following SOLID principles and clean architecture from GEMINI.md:
 - Dependency Inversion: Depend on abstractions, not concrete implementations
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, UTC
 from enum import Enum
-from typing import AsyncIterator, Literal
+from functools import cached_property
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal
 
-from pydantic import BaseModel, Field
+import msgspec
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from ai_core.llm._ratelimit import RateLimiter
+from ai_core.llm.exceptions import LLMRateLimitError
 
 
 class LLMProvider(str, Enum):
@@ -46,10 +62,13 @@ class LLMMessage(BaseModel):
     function_call: dict | None = None
 
 
-class LLMUsage(BaseModel):
+class LLMUsage(msgspec.Struct, frozen=True, gc=False):
     """
     Token usage and cost tracking.
     Essential for production AI systems.
+    
+    A msgspec Struct like LLMStreamChunk: one is built per response and
+    per streamed usage chunk, and it is never validated input.
     """
     prompt_tokens: int = 0
     completion_tokens: int = 0
@@ -60,10 +79,19 @@ class LLMUsage(BaseModel):
     completion_cost: float = 0.0
     total_cost: float = 0.0
     
+    # Prompt-cache hits (a subset of prompt_tokens) and their share of
+    # prompt_cost, billed at the provider's discounted rate
+    cached_tokens: int = 0
+    cached_cost: float = 0.0
+    
     @property
     def cost_per_token(self) -> float:
         """Calculate average cost per token."""
         return self.total_cost / self.total_tokens if self.total_tokens > 0 else 0.0
+    
+    def model_dump(self) -> dict:
+        """Pydantic-compatible dict conversion."""
+        return msgspec.structs.asdict(self)
 
 
 class LLMResponse(BaseModel):
@@ -74,6 +102,9 @@ class LLMResponse(BaseModel):
     - Convert provider-specific responses to this format
     - Internal code works with consistent interface
     """
+    # usage is a msgspec Struct, checked by isinstance
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     content: str = Field(..., description="Generated text content")
     model: str = Field(..., description="Model identifier used")
     provider: LLMProvider = Field(..., description="LLM provider")
@@ -84,21 +115,85 @@ class LLMResponse(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     
     # Provider-specific data
-    raw_response: dict = Field(default_factory=dict, description="Original provider response")
+    raw_response: Any = Field(
+        default=None,
+        description="Original provider response (SDK object or dict)",
+    )
     
     # Function calling
     function_call: dict | None = None
     tool_calls: list[dict] = Field(default_factory=list)
+    
+    @cached_property
+    def raw_dict(self) -> dict:
+        """
+        Provider response as a plain dict.
+        
+        Clients store the SDK response object as-is; serializing it (e.g.
+        walking a protobuf) is deferred until someone actually reads it.
+        """
+        raw = self.raw_response
+        if raw is None:
+            return {}
+        if isinstance(raw, dict):
+            return raw
+        for method in ("model_dump", "to_dict"):
+            if hasattr(raw, method):
+                return getattr(raw, method)()
+        return dict(raw)
+    
+    @field_serializer("usage")
+    def _serialize_usage(self, usage: LLMUsage) -> dict:
+        return usage.model_dump()
+    
+    @field_serializer("raw_response")
+    def _serialize_raw_response(self, raw_response: Any) -> dict:
+        return self.raw_dict
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (pydantic-core, no stdlib json pass)."""
+        return self.__pydantic_serializer__.to_json(self)
 
 
-class LLMStreamChunk(BaseModel):
+class LLMStreamChunk(msgspec.Struct, frozen=True, gc=False):
     """
     Chunk from streaming response.
     Emitted progressively as tokens are generated.
+    
+    A msgspec Struct rather than a Pydantic model: one is allocated per
+    token, so construction cost matters more than validation here.
     """
-    delta: str = Field(..., description="Incremental text content")
+    delta: str  # Incremental text content
     finish_reason: str | None = None
     usage: LLMUsage | None = None
+    
+    def model_dump(self) -> dict:
+        """Pydantic-compatible dict conversion."""
+        data = msgspec.structs.asdict(self)
+        if self.usage is not None:
+            data["usage"] = self.usage.model_dump()
+        return data
+
+
+def debug_enabled(logger: Any) -> bool:
+    """
+    Whether a structlog/stdlib logger would emit DEBUG records.
+    
+    Guarding debug calls with this skips building their event dicts (and
+    running processors) when debug logging is off.
+    """
+    check = getattr(logger, "is_enabled_for", None) or getattr(logger, "isEnabledFor", None)
+    return check(logging.DEBUG) if check is not None else True
+
+
+# Deterministic (temperature == 0) completions, shared by all clients
+_response_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_response_cache_stats = {"hits": 0, "misses": 0}
+
+
+def response_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters of the completion response cache."""
+    return dict(_response_cache_stats)
 
 
 class LLMClient(ABC):
@@ -115,6 +210,22 @@ class LLMClient(ABC):
     - Cost-aware with token tracking
     """
     
+    # Errors worth retrying in batch operations (providers extend this with
+    # their SDK's rate-limit/timeout exceptions)
+    _retryable_errors: tuple[type[BaseException], ...] = (
+        LLMRateLimitError,
+        TimeoutError,
+        ConnectionError,
+    )
+    
+    # Whether embed() already rate-limits and retries its own requests;
+    # batch_embed() then doesn't add a second limiter and retry loop
+    _embed_paced: bool = False
+    
+    # Endpoint the client talks to, for providers with a configurable host
+    # (None means the provider's default)
+    base_url: str | None = None
+    
     def __init__(
         self,
         api_key: str | None = None,
@@ -132,6 +243,7 @@ class LLMClient(ABC):
         self.api_key = api_key
         self.model = model
         self.config = kwargs
+        self._prewarm_task: asyncio.Task | None = None
     
     @property
     @abstractmethod
@@ -227,6 +339,103 @@ class LLMClient(ABC):
         """
         ...
     
+    async def batch_embed(
+        self,
+        texts: list[str],
+        model: str | None = None,
+        batch_size: int = 96,
+        max_concurrency: int = 8,
+        max_tpm: float = 1_000_000,
+        max_rpm: float = 3_000,
+        max_attempts: int = 5,
+    ) -> list[list[float]]:
+        """
+        Embed a large list of texts in rate-limited, concurrent batches.
+        
+        Intended for indexing jobs: batches are paced to the given
+        tokens/requests-per-minute budgets and retried with exponential
+        backoff on transient errors.
+        
+        Args:
+            texts: Texts to embed
+            model: Override default embedding model
+            batch_size: Texts per embed() call
+            max_concurrency: Batches in flight at once
+            max_tpm: Tokens-per-minute budget (estimated ~4 bytes/token)
+            max_rpm: Requests-per-minute budget
+            max_attempts: Attempts per batch before giving up
+        
+        Returns:
+            Embedding vectors in the same order as texts
+        
+        Providers whose embed() paces and retries itself (_embed_paced)
+        ignore max_tpm, max_rpm and max_attempts.
+        """
+        limiter = RateLimiter(rpm=max_rpm, tpm=max_tpm)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            if self._embed_paced:
+                async with semaphore:
+                    return await self.embed(batch, model=model)
+            
+            tokens = sum(len(text.encode("utf-8")) for text in batch) // 4
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type(self._retryable_errors),
+                stop=stop_after_attempt(max_attempts),
+                wait=wait_exponential_jitter(initial=1, max=30),
+                reraise=True,
+            ):
+                with attempt:
+                    await limiter.acquire(tokens)
+                    async with semaphore:
+                        return await self.embed(batch, model=model)
+        
+        # gather() keeps batch order, so results line up with texts
+        batches = await asyncio.gather(*(
+            embed_batch(texts[i:i + batch_size])
+            for i in range(0, len(texts), batch_size)
+        ))
+        return [vector for batch in batches for vector in batch]
+    
+    async def _maybe_cache_complete(
+        self,
+        key_inputs: dict,
+        coro_factory: Callable[[], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """
+        Serve a completion from the response cache, or run and store it.
+        
+        Only call for deterministic requests (temperature == 0).
+        
+        Args:
+            key_inputs: JSON-serializable request fields (model, messages, ...)
+            coro_factory: Performs the actual request on a cache miss
+        """
+        # The cache is process-wide: key on the endpoint and credentials too,
+        # so different hosts or accounts never share responses
+        payload = json.dumps(
+            {
+                "provider": self.provider.value,
+                "base_url": self.base_url,
+                "api_key": hashlib.sha256((self.api_key or "").encode("utf-8")).hexdigest(),
+                **key_inputs,
+            },
+            sort_keys=True,
+        )
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        
+        response = _response_cache.get(key)
+        if response is not None:
+            _response_cache_stats["hits"] += 1
+            # Callers may modify their response; keep the cached one intact
+            return response.model_copy()
+        
+        _response_cache_stats["misses"] += 1
+        response = await coro_factory()
+        _response_cache[key] = response
+        return response
+    
     async def count_tokens(
         self,
         text: str,
@@ -236,7 +445,7 @@ class LLMClient(ABC):
         Count tokens in text.
         
         Default implementation (override for accuracy).
-        Uses rough approximation: ~4 chars per token.
+        Uses rough approximation: ~4 UTF-8 bytes per token.
         
         Args:
             text: Text to count tokens for
@@ -245,8 +454,9 @@ class LLMClient(ABC):
         Returns:
             Estimated token count
         """
-        # Rough approximation: 4 characters ≈ 1 token
-        return len(text) // 4
+        # Bytes track token counts more closely than characters for
+        # non-ASCII text (CJK, emoji), where len(text) under-counts.
+        return len(text.encode("utf-8")) // 4
     
     def calculate_cost(
         self,
@@ -284,11 +494,43 @@ class LLMClient(ABC):
             True if service is healthy
         """
         try:
+            # Default (non-zero) temperature: a cached response would not
+            # prove the service is reachable
             response = await self.complete(
                 prompt="Say 'OK'",
                 max_tokens=5,
-                temperature=0.0,
             )
             return len(response.content) > 0
         except Exception:
             return False
+    
+    def _schedule_prewarm(self) -> None:
+        """
+        Open a connection in the background so the first request skips
+        DNS/TCP/TLS setup.
+        
+        Runs at most once, and only when constructed inside a running loop.
+        """
+        if self._prewarm_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._prewarm_task = loop.create_task(self._prewarm())
+    
+    async def _prewarm(self) -> None:
+        """Issue a cheap request to warm the connection (override per provider)."""
+    
+    async def close(self) -> None:
+        """
+        Release network resources held by this client.
+        
+        Default is a no-op; providers owning a connection pool override it.
+        """
+    
+    async def __aenter__(self) -> "LLMClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -6,13 +6,19 @@ Factory pattern for creating LLM clients.
 Automatically selects provider based on environment configuration.
 """
 
+import asyncio
+import hashlib
 import os
+import weakref
 from functools import lru_cache
-from typing import Literal
+from types import MappingProxyType
+from typing import Literal, Mapping, NamedTuple
 
 import structlog
+from cachetools import LRUCache
 
-from ai_core.llm.base import LLMClient, LLMProvider
+from ai_core.llm._http import aclose_http_client
+from ai_core.llm.base import LLMClient, LLMProvider, response_cache_stats
 from ai_core.llm.openai import OpenAIClient
 from ai_core.llm.anthropic import AnthropicClient
 from ai_core.llm.gemini import GeminiClient
@@ -24,51 +30,139 @@ logger = structlog.get_logger(__name__)
 LLMProviderType = Literal["openai", "anthropic", "gemini", "ollama"]
 
 
-@lru_cache(maxsize=4)
+class _ProviderSpec(NamedTuple):
+    """Static description of a provider: client class and its env settings."""
+    cls: type[LLMClient]
+    env_key: str | None  # API key variable; None for keyless providers
+    model_env: str
+    default_model: str
+
+
+# Single source of truth for provider dispatch and env variable names
+_PROVIDERS: dict[str, _ProviderSpec] = {
+    "openai": _ProviderSpec(OpenAIClient, "OPENAI_API_KEY", "OPENAI_MODEL", "gpt-4-turbo-preview"),
+    "anthropic": _ProviderSpec(AnthropicClient, "ANTHROPIC_API_KEY", "ANTHROPIC_MODEL", "claude-3-opus-20240229"),
+    "gemini": _ProviderSpec(GeminiClient, "GOOGLE_API_KEY", "GEMINI_MODEL", "gemini-1.5-pro"),
+    "ollama": _ProviderSpec(OllamaClient, None, "OLLAMA_MODEL", "llama3.2"),
+}
+
+# Environment variables read by the factory, with their defaults
+_ENV_DEFAULTS: dict[str, str | None] = {
+    "LLM_PROVIDER": "openai",
+    "OLLAMA_BASE_URL": "http://localhost:11434",
+}
+for _spec in _PROVIDERS.values():
+    if _spec.env_key:
+        _ENV_DEFAULTS[_spec.env_key] = None
+    _ENV_DEFAULTS[_spec.model_env] = _spec.default_model
+del _spec
+
+
+@lru_cache(maxsize=1)
+def _env_config() -> Mapping[str, str | None]:
+    """
+    Snapshot of the factory's environment variables.
+    
+    Read once per process instead of on every get_llm_client() call.
+    """
+    return MappingProxyType({
+        name: os.getenv(name, default)
+        for name, default in _ENV_DEFAULTS.items()
+    })
+
+
+def invalidate_env_cache() -> None:
+    """Drop the environment snapshot so it is re-read on next use (e.g. in tests)."""
+    _env_config.cache_clear()
+
+
+def _key_digest(api_key: str | None) -> str:
+    """Stable, non-reversible cache key for an API key."""
+    if not api_key:
+        return ""
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+
+class _ClientCache(LRUCache):
+    """
+    LRU cache of LLM clients.
+    
+    Evicted clients may still be held by callers (e.g. a RAG pipeline), so
+    they are not closed here; they are tracked and closed by
+    close_llm_clients() at shutdown.
+    """
+    
+    def popitem(self):
+        key, client = super().popitem()
+        _retired_clients.add(client)
+        return key, client
+
+
+_client_cache: _ClientCache = _ClientCache(maxsize=32)
+
+# Evicted or cleared clients still in use somewhere; weak so clients nobody
+# holds any more are released normally
+_retired_clients: weakref.WeakSet[LLMClient] = weakref.WeakSet()
+
+
 def _get_cached_client(
     provider: LLMProviderType,
     api_key: str | None,
-    model: str | None,
+    model: str,
 ) -> LLMClient:
     """
-    Create and cache LLM client.
-    
-    Cached by (provider, api_key, model) to reuse connections.
-    """
-    if provider == "openai":
-        if not api_key:
-            raise LLMAuthenticationError(
-                "OPENAI_API_KEY environment variable not set",
-                provider="openai",
-            )
-        return OpenAIClient(api_key=api_key, model=model)
-    
-    elif provider == "anthropic":
-        if not api_key:
-            raise LLMAuthenticationError(
-                "ANTHROPIC_API_KEY environment variable not set",
-                provider="anthropic",
-            )
-        return AnthropicClient(api_key=api_key, model=model)
-    
-    elif provider == "gemini":
-        if not api_key:
-            raise LLMAuthenticationError(
-                "GOOGLE_API_KEY environment variable not set",
-                provider="gemini",
-            )
-        return GeminiClient(api_key=api_key, model=model)
-    
-    elif provider == "ollama":
-        # Ollama doesn't need API key
-        base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-        return OllamaClient(base_url=base_url, model=model)
-    
-    else:
+    Get or create a cached LLM client.
+    
+    Cached by the fully resolved (provider, api_key digest, model) so every
+    call for the same effective configuration shares one client and its
+    connection pool. The digest keeps the secret out of the cache key.
+    """
+    key = (provider, _key_digest(api_key), model)
+    
+    client = _client_cache.get(key)
+    if client is None:
+        client = _client_cache[key] = _create_client(provider, api_key, model)
+    return client
+
+
+def _get_spec(provider: str) -> _ProviderSpec:
+    """Look up a provider spec, raising for unknown providers."""
+    spec = _PROVIDERS.get(provider)
+    if spec is None:
         raise LLMProviderError(
             f"Unknown provider: {provider}",
             provider=provider,
         )
+    return spec
+
+
+def _instantiate(
+    spec: _ProviderSpec,
+    api_key: str | None,
+    model: str,
+    **kwargs,
+) -> LLMClient:
+    """Construct a client from its spec."""
+    if spec.env_key is None:
+        # Ollama doesn't need API key; it is configured by base URL instead
+        kwargs.setdefault("base_url", _env_config()["OLLAMA_BASE_URL"])
+        return spec.cls(model=model, **kwargs)
+    return spec.cls(api_key=api_key, model=model, **kwargs)
+
+
+def _create_client(
+    provider: LLMProviderType,
+    api_key: str | None,
+    model: str,
+) -> LLMClient:
+    """Create an LLM client with default configuration."""
+    spec = _get_spec(provider)
+    if spec.env_key is not None and not api_key:
+        raise LLMAuthenticationError(
+            f"{spec.env_key} environment variable not set",
+            provider=provider,
+        )
+    return _instantiate(spec, api_key, model)
 
 
 def get_llm_client(
@@ -116,29 +210,18 @@ def get_llm_client(
         OLLAMA_BASE_URL: Ollama server URL
         OLLAMA_MODEL: Default Ollama model
     """
+    env = _env_config()
+    
     # Get provider from argument or environment
-    provider = provider or os.getenv("LLM_PROVIDER", "openai")
-    
-    # Get API key from argument or environment
-    if api_key is None:
-        if provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-        elif provider == "anthropic":
-            api_key = os.getenv("ANTHROPIC_API_KEY")
-        elif provider == "gemini":
-            api_key = os.getenv("GOOGLE_API_KEY")
-        # Ollama doesn't need API key
-    
-    # Get model from argument or environment
+    provider = provider or env["LLM_PROVIDER"]
+    
+    spec = _get_spec(provider)
+    
+    # Get API key and model from arguments or environment
+    if api_key is None and spec.env_key is not None:
+        api_key = env[spec.env_key]
     if model is None:
-        if provider == "openai":
-            model = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
-        elif provider == "anthropic":
-            model = os.getenv("ANTHROPIC_MODEL", "claude-3-opus-20240229")
-        elif provider == "gemini":
-            model = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")
-        elif provider == "ollama":
-            model = os.getenv("OLLAMA_MODEL", "llama3.2")
+        model = env[spec.model_env]
     
     logger.info(
         "Creating LLM client",
@@ -152,15 +235,34 @@ def get_llm_client(
         return _get_cached_client(provider, api_key, model)
     
     # Create fresh client with custom kwargs
-    if provider == "openai":
-        return OpenAIClient(api_key=api_key, model=model, **kwargs)
-    elif provider == "anthropic":
-        return AnthropicClient(api_key=api_key, model=model, **kwargs)
-    elif provider == "gemini":
-        return GeminiClient(api_key=api_key, model=model, **kwargs)
-    elif provider == "ollama":
-        base_url = kwargs.pop("base_url", os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
-        return OllamaClient(base_url=base_url, model=model, **kwargs)
+    return _instantiate(spec, api_key, model, **kwargs)
+
+
+def clear_client_cache() -> None:
+    """
+    Drop all cached clients (e.g. in tests or after rotating keys).
+    
+    Clients are left open for callers still holding them; see
+    close_llm_clients().
+    """
+    _client_cache.clear()
+
+
+async def close_llm_clients() -> None:
+    """
+    Close and drop all cached and previously evicted clients, then the
+    shared HTTP pool.
+    
+    Call on application shutdown to release connection pools.
+    """
+    clients = {*_client_cache.values(), *_retired_clients}
+    # Delete keys directly: clear() goes through popitem(), which would
+    # retire every client again
+    for key in list(_client_cache):
+        del _client_cache[key]
+    _retired_clients.clear()
+    await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+    await aclose_http_client()
 
 
 def list_available_providers() -> list[str]:
@@ -170,18 +272,12 @@ def list_available_providers() -> list[str]:
     Returns:
         List of provider names with valid API keys
     """
-    available = []
-    
-    if os.getenv("OPENAI_API_KEY"):
-        available.append("openai")
-    if os.getenv("ANTHROPIC_API_KEY"):
-        available.append("anthropic")
-    if os.getenv("GOOGLE_API_KEY"):
-        available.append("gemini")
-    # Ollama is always available if running locally
-    available.append("ollama")
-    
-    return available
+    env = _env_config()
+    # Keyless providers (Ollama) are always available if running locally
+    return [
+        name for name, spec in _PROVIDERS.items()
+        if spec.env_key is None or env[spec.env_key]
+    ]
 
 
 def get_provider_info() -> dict[str, dict]:
@@ -191,13 +287,10 @@ def get_provider_info() -> dict[str, dict]:
     Returns:
         Dictionary with provider configuration details
     """
+    env = _env_config()
     return {
-        "configured_provider": os.getenv("LLM_PROVIDER", "openai"),
+        "configured_provider": env["LLM_PROVIDER"],
         "available_providers": list_available_providers(),
-        "models": {
-            "openai": os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"),
-            "anthropic": os.getenv("ANTHROPIC_MODEL", "claude-3-opus-20240229"),
-            "gemini": os.getenv("GEMINI_MODEL", "gemini-1.5-pro"),
-            "ollama": os.getenv("OLLAMA_MODEL", "llama3.2"),
-        },
+        "models": {name: env[spec.model_env] for name, spec in _PROVIDERS.items()},
+        "response_cache": response_cache_stats(),
     }
@@ -10,10 +10,14 @@ Supports:
 - Vision, audio, video inputs
 """
 
+import asyncio
+import re
 import structlog
+from functools import lru_cache
 from typing import AsyncIterator
 
 import google.generativeai as genai
+import numpy as np
 from google.generativeai.types import GenerateContentResponse, ContentDict
 
 from ai_core.llm.base import (
@@ -24,6 +28,7 @@ from ai_core.llm.base import (
     LLMRole,
     LLMUsage,
     LLMStreamChunk,
+    debug_enabled,
 )
 
 logger = structlog.get_logger(__name__)
@@ -36,6 +41,32 @@ GEMINI_PRICING = {
     "gemini-1.0-pro": {"prompt": 0.50, "completion": 1.50},
 }
 
+# Version aliases priced like their base model (e.g. gemini-1.5-pro-002)
+_MODEL_ALIAS_SUFFIX = re.compile(r"-(?:latest|\d{3})$")
+
+
+@lru_cache(maxsize=64)
+def _price(model: str) -> dict[str, float]:
+    """Pricing for a model name, resolving aliases; defaults to 1.5 Pro."""
+    model = model.removeprefix("models/")
+    pricing = GEMINI_PRICING.get(model) or GEMINI_PRICING.get(_MODEL_ALIAS_SUFFIX.sub("", model))
+    return pricing or GEMINI_PRICING["gemini-1.5-pro"]
+
+
+# Gemini uses "user" and "model" roles (system messages are folded into
+# the first user turn by _convert_messages)
+_GEMINI_ROLE_MAP = {
+    LLMRole.ASSISTANT: "model",
+    LLMRole.USER: "user",
+    LLMRole.FUNCTION: "user",
+}
+
+# Texts per batch embed_content request (API batch limit)
+GEMINI_EMBED_BATCH_SIZE = 100
+
+# Terminal stream chunk; Struct chunks are frozen, so one instance is shared
+_STOP_CHUNK = LLMStreamChunk(delta="", finish_reason="stop")
+
 
 class GeminiClient(LLMClient):
     """
@@ -47,16 +78,29 @@ class GeminiClient(LLMClient):
     - Fast inference (Gemini Flash)
     """
     
+    default_model = "gemini-1.5-pro"
+    
     def __init__(
         self,
         api_key: str,
         model: str = "gemini-1.5-pro",
+        prewarm: bool = True,
         **kwargs,
     ):
         super().__init__(api_key=api_key, model=model, **kwargs)
+        # Resolved once; shadows the class-level fallback
+        self.default_model = model or GeminiClient.default_model
         
         genai.configure(api_key=api_key)
-        self.client = genai.GenerativeModel(model or self.default_model)
+        self.client = genai.GenerativeModel(self.default_model)
+        
+        # One GenerativeModel per model name, reused across calls
+        self._model_cache: dict[str, genai.GenerativeModel] = {
+            self.default_model: self.client,
+        }
+        
+        if prewarm:
+            self._schedule_prewarm()
         
         logger.info("Gemini client initialized", model=model)
     
@@ -64,9 +108,25 @@ class GeminiClient(LLMClient):
     def provider(self) -> LLMProvider:
         return LLMProvider.GEMINI
     
-    @property
-    def default_model(self) -> str:
-        return self.model or "gemini-1.5-pro"
+    async def _prewarm(self) -> None:
+        """Open the gRPC channel with a one-page model listing."""
+        try:
+            await asyncio.to_thread(next, genai.list_models(page_size=1), None)
+        except Exception as e:
+            logger.debug("Gemini prewarm failed", error=str(e))
+    
+    async def close(self) -> None:
+        """Drop cached model handles (gRPC channels are owned by the SDK)."""
+        self._model_cache.clear()
+    
+    def _model_for(self, model: str) -> genai.GenerativeModel:
+        """Get (or create and cache) the GenerativeModel for a model name."""
+        if model == self.default_model:
+            return self.client
+        client = self._model_cache.get(model)
+        if client is None:
+            client = self._model_cache[model] = genai.GenerativeModel(model)
+        return client
     
     def _convert_messages(
         self,
@@ -76,27 +136,26 @@ class GeminiClient(LLMClient):
         if isinstance(prompt, str):
             return [{"role": "user", "parts": [prompt]}]
         
+        # System messages are collected separately and prepended once,
+        # instead of inserting at the front of the list per message
+        system_parts: list[str] = []
         messages = []
         for msg in prompt:
-            # Gemini uses "user" and "model" roles
-            role = "model" if msg.role == LLMRole.ASSISTANT else "user"
-            
-            # Skip system messages (add them to user context instead)
             if msg.role == LLMRole.SYSTEM:
-                # Prepend system message to first user message
-                if messages and messages[0]["role"] == "user":
-                    messages[0]["parts"].insert(0, f"Instructions: {msg.content}\n\n")
-                else:
-                    messages.insert(0, {
-                        "role": "user",
-                        "parts": [f"Instructions: {msg.content}\n\n"]
-                    })
+                system_parts.append(f"Instructions: {msg.content}\n\n")
             else:
                 messages.append({
-                    "role": role,
+                    "role": _GEMINI_ROLE_MAP[msg.role],
                     "parts": [msg.content],
                 })
         
+        # Gemini has no system role: fold instructions into the first user turn
+        if system_parts:
+            if messages and messages[0]["role"] == "user":
+                messages[0]["parts"] = system_parts + messages[0]["parts"]
+            else:
+                messages.insert(0, {"role": "user", "parts": system_parts})
+        
         return messages
     
     def _parse_usage(
@@ -111,7 +170,7 @@ class GeminiClient(LLMClient):
         completion_tokens = usage_metadata.candidates_token_count if usage_metadata else 0
         
         # Get pricing for model
-        pricing = GEMINI_PRICING.get(model, GEMINI_PRICING["gemini-1.5-pro"])
+        pricing = _price(model)
         
         # Calculate cost (pricing is per 1M tokens)
         prompt_cost = (prompt_tokens / 1_000_000) * pricing["prompt"]
@@ -126,6 +185,37 @@ class GeminiClient(LLMClient):
             total_cost=prompt_cost + completion_cost,
         )
     
+    @staticmethod
+    def parse_usage_batch(
+        responses: list[GenerateContentResponse],
+        model: str,
+    ) -> np.ndarray:
+        """
+        Compute costs for many responses at once (e.g. analytics rollups).
+        
+        Args:
+            responses: Gemini responses, all for the same model
+            model: Model used (determines pricing)
+        
+        Returns:
+            (N, 3) float64 array of (prompt_cost, completion_cost, total_cost)
+        """
+        tokens = np.array(
+            [
+                (meta.prompt_token_count, meta.candidates_token_count) if meta else (0, 0)
+                for meta in (response.usage_metadata for response in responses)
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        
+        pricing = _price(model)
+        rates = np.array([pricing["prompt"], pricing["completion"]]) / 1_000_000
+        
+        costs = np.empty((len(responses), 3))
+        np.multiply(tokens, rates, out=costs[:, :2])
+        np.add(costs[:, 0], costs[:, 1], out=costs[:, 2])
+        return costs
+    
     async def complete(
         self,
         prompt: str | list[LLMMessage],
@@ -137,20 +227,35 @@ class GeminiClient(LLMClient):
     ) -> LLMResponse:
         """Generate completion using Gemini."""
         model = model or self.default_model
+        messages = self._convert_messages(prompt)
         
-        # Create model if different from initialized
-        if model != self.client.model_name:
-            client = genai.GenerativeModel(model)
-        else:
-            client = self.client
+        # Deterministic requests are served from the shared response cache
+        if temperature == 0 and not kwargs:
+            return await self._maybe_cache_complete(
+                {"model": model, "messages": messages, "stop": stop, "max_tokens": max_tokens},
+                lambda: self._complete(messages, model, temperature, max_tokens, stop),
+            )
         
-        messages = self._convert_messages(prompt)
+        return await self._complete(messages, model, temperature, max_tokens, stop, **kwargs)
+    
+    async def _complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float,
+        max_tokens: int | None,
+        stop: list[str] | None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Send a completion request (bypasses the response cache)."""
+        client = self._model_for(model)
         
-        logger.debug(
-            "Gemini completion request",
-            model=model,
-            message_count=len(messages),
-        )
+        if debug_enabled(logger):
+            logger.debug(
+                "Gemini completion request",
+                model=model,
+                message_count=len(messages),
+            )
         
         try:
             # Build generation config
@@ -185,7 +290,7 @@ class GeminiClient(LLMClient):
                 provider=self.provider,
                 usage=usage,
                 finish_reason=response.candidates[0].finish_reason.name if response.candidates else None,
-                raw_response={"candidates": [c.to_dict() for c in response.candidates]},
+                raw_response=response,
             )
             
         except Exception as e:
@@ -206,15 +311,12 @@ class GeminiClient(LLMClient):
     ) -> AsyncIterator[LLMStreamChunk]:
         """Stream completion token-by-token."""
         model = model or self.default_model
-        
-        if model != self.client.model_name:
-            client = genai.GenerativeModel(model)
-        else:
-            client = self.client
+        client = self._model_for(model)
         
         messages = self._convert_messages(prompt)
         
-        logger.debug("Gemini streaming request", model=model)
+        if debug_enabled(logger):
+            logger.debug("Gemini streaming request", model=model)
         
         try:
             generation_config = {
@@ -230,20 +332,21 @@ class GeminiClient(LLMClient):
                 **kwargs,
             )
             
+            # One chunk of lookahead: the last delta is yielded together
+            # with the finish reason rather than followed by an empty chunk
+            pending = ""
             async for chunk in response:
                 if chunk.text:
-                    yield LLMStreamChunk(
-                        delta=chunk.text,
-                        finish_reason=None,
-                    )
+                    if pending:
+                        yield LLMStreamChunk(delta=pending)
+                    pending = chunk.text
             
             # TODO: Gemini doesn't provide usage in stream yet
             # Final chunk would include usage when available
-            yield LLMStreamChunk(
-                delta="",
-                finish_reason="stop",
-                usage=None,
-            )
+            if pending:
+                yield LLMStreamChunk(delta=pending, finish_reason="stop")
+            else:
+                yield _STOP_CHUNK
             
             logger.info("Gemini streaming complete", model=model)
             
@@ -269,23 +372,21 @@ class GeminiClient(LLMClient):
         model = model or "models/embedding-001"
         texts = [text] if isinstance(text, str) else text
         
-        logger.debug(
-            "Gemini embedding request",
-            model=model,
-            text_count=len(texts),
-        )
+        if debug_enabled(logger):
+            logger.debug(
+                "Gemini embedding request",
+                model=model,
+                text_count=len(texts),
+            )
         
         try:
-            embeddings = []
-            
-            for text_item in texts:
-                result = genai.embed_content(
-                    model=model,
-                    content=text_item,
-                    task_type="retrieval_document",
-                    **kwargs,
-                )
-                embeddings.append(result["embedding"])
+            # One batch request per chunk of texts; chunks run concurrently
+            # in worker threads since embed_content is synchronous
+            batches = await asyncio.gather(*(
+                self._embed_batch(texts[i:i + GEMINI_EMBED_BATCH_SIZE], model, **kwargs)
+                for i in range(0, len(texts), GEMINI_EMBED_BATCH_SIZE)
+            ))
+            embeddings = [vector for batch in batches for vector in batch]
             
             logger.info(
                 "Gemini embedding success",
@@ -303,3 +404,34 @@ class GeminiClient(LLMClient):
                 error=str(e),
             )
             raise
+    
+    async def _embed_batch(
+        self,
+        texts: list[str],
+        model: str,
+        **kwargs,
+    ) -> list[list[float]]:
+        """Embed a chunk of texts with a single batch request."""
+        try:
+            result = await asyncio.to_thread(
+                genai.embed_content,
+                model=model,
+                content=texts,
+                task_type="retrieval_document",
+                **kwargs,
+            )
+            # List input yields a list of embeddings
+            return result["embedding"]
+        except TypeError:
+            # SDK without list support: fall back to one request per text
+            results = await asyncio.gather(*(
+                asyncio.to_thread(
+                    genai.embed_content,
+                    model=model,
+                    content=text_item,
+                    task_type="retrieval_document",
+                    **kwargs,
+                )
+                for text_item in texts
+            ))
+            return [result["embedding"] for result in results]
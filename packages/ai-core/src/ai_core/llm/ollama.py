@@ -10,11 +10,15 @@ Supports:
 - Custom model loading
 """
 
+import asyncio
+import time
 import structlog
-from typing import AsyncIterator
+from typing import AsyncIterator, Callable
 
+import httpx
 from ollama import AsyncClient
 
+from ai_core.llm._http import HTTP_LIMITS
 from ai_core.llm.base import (
     LLMClient,
     LLMProvider,
@@ -23,10 +27,42 @@ from ai_core.llm.base import (
     LLMRole,
     LLMUsage,
     LLMStreamChunk,
+    debug_enabled,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Local generation can be slow, so only the connect phase is kept tight
+OLLAMA_HTTP_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+
+# Ollama role strings match ours; precomputed to skip the .value lookup
+_OLLAMA_ROLE_MAP = {role: role.value for role in LLMRole}
+
+
+def _make_message_converter(
+    role_map: dict[LLMRole, str],
+) -> Callable[[str | list[LLMMessage]], list[dict]]:
+    """
+    Build a message converter with the role map bound in a closure.
+    
+    The map is read from a closure cell (a fast local-style load) rather
+    than a module global on every message.
+    """
+    def convert(prompt: str | list[LLMMessage]) -> list[dict]:
+        """Convert unified messages to Ollama format."""
+        if isinstance(prompt, str):
+            return [{"role": "user", "content": prompt}]
+        
+        return [
+            {
+                "role": role_map[msg.role],
+                "content": msg.content,
+            }
+            for msg in prompt
+        ]
+    
+    return convert
+
 
 class OllamaClient(LLMClient):
     """
@@ -39,16 +75,43 @@ class OllamaClient(LLMClient):
     - Multiple open-source models
     """
     
+    default_model = "llama3.2"
+    
+    _convert_messages = staticmethod(_make_message_converter(_OLLAMA_ROLE_MAP))
+    
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
         model: str = "llama3.2",
+        max_embed_concurrency: int = 8,
+        models_cache_ttl: float = 30.0,
+        prewarm: bool = True,
         **kwargs,
     ):
         super().__init__(api_key=None, model=model, **kwargs)
+        # Resolved once; shadows the class-level fallback
+        self.default_model = model or OllamaClient.default_model
         
-        self.client = AsyncClient(host=base_url)
+        # The SDK builds its own httpx.AsyncClient (it cannot take an
+        # instance), so it gets the shared pool's limits instead
+        self.client = AsyncClient(
+            host=base_url,
+            limits=HTTP_LIMITS,
+            timeout=OLLAMA_HTTP_TIMEOUT,
+        )
         self.base_url = base_url
+        # Underlying httpx.AsyncClient; the SDK does not expose a close()
+        self._http: httpx.AsyncClient = self.client._client
+        
+        # Bounds concurrent requests when embedding a batch of texts
+        self._embed_semaphore = asyncio.Semaphore(max_embed_concurrency)
+        
+        # (fetched_at, names) of the last /api/tags listing
+        self._models_cache: tuple[float, frozenset[str]] | None = None
+        self._models_cache_ttl = models_cache_ttl
+        
+        if prewarm:
+            self._schedule_prewarm()
         
         logger.info(
             "Ollama client initialized",
@@ -60,25 +123,20 @@ class OllamaClient(LLMClient):
     def provider(self) -> LLMProvider:
         return LLMProvider.OLLAMA
     
-    @property
-    def default_model(self) -> str:
-        return self.model or "llama3.2"
+    async def _prewarm(self) -> None:
+        """Open a pooled keep-alive connection by listing local models."""
+        try:
+            response = await self.client.list()
+            # Seed the model listing cache while we're at it
+            names = frozenset(model.model for model in response.models if model.model)
+        except Exception as e:
+            logger.debug("Ollama prewarm failed", error=str(e))
+            return
+        self._models_cache = (time.monotonic(), names)
     
-    def _convert_messages(
-        self,
-        prompt: str | list[LLMMessage],
-    ) -> list[dict]:
-        """Convert unified messages to Ollama format."""
-        if isinstance(prompt, str):
-            return [{"role": "user", "content": prompt}]
-        
-        return [
-            {
-                "role": msg.role.value,
-                "content": msg.content,
-            }
-            for msg in prompt
-        ]
+    async def close(self) -> None:
+        """Close the HTTP connection pool."""
+        await self._http.aclose()
     
     def _parse_usage(
         self,
@@ -116,11 +174,31 @@ class OllamaClient(LLMClient):
         model = model or self.default_model
         messages = self._convert_messages(prompt)
         
-        logger.debug(
-            "Ollama completion request",
-            model=model,
-            message_count=len(messages),
-        )
+        # Deterministic requests are served from the shared response cache
+        if temperature == 0 and not kwargs:
+            return await self._maybe_cache_complete(
+                {"model": model, "messages": messages, "stop": stop, "max_tokens": max_tokens},
+                lambda: self._complete(messages, model, temperature, max_tokens, stop),
+            )
+        
+        return await self._complete(messages, model, temperature, max_tokens, stop, **kwargs)
+    
+    async def _complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float,
+        max_tokens: int | None,
+        stop: list[str] | None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Send a completion request (bypasses the response cache)."""
+        if debug_enabled(logger):
+            logger.debug(
+                "Ollama completion request",
+                model=model,
+                message_count=len(messages),
+            )
         
         try:
             response = await self.client.chat(
@@ -172,7 +250,8 @@ class OllamaClient(LLMClient):
         model = model or self.default_model
         messages = self._convert_messages(prompt)
         
-        logger.debug("Ollama streaming request", model=model)
+        if debug_enabled(logger):
+            logger.debug("Ollama streaming request", model=model)
         
         try:
             stream = await self.client.chat(
@@ -186,23 +265,29 @@ class OllamaClient(LLMClient):
                 },
             )
             
+            # Hold back one delta so the last one can carry the finish
+            # reason and usage, instead of yielding an extra empty chunk
+            pending = ""
             async for chunk in stream:
                 delta = chunk["message"]["content"]
                 
-                if delta:
-                    yield LLMStreamChunk(
-                        delta=delta,
-                        finish_reason=None,
-                    )
-                
                 # Final chunk
                 if chunk.get("done"):
                     usage = self._parse_usage(chunk, model)
                     yield LLMStreamChunk(
-                        delta="",
+                        delta=pending + delta,
                         finish_reason=chunk.get("done_reason", "stop"),
                         usage=usage,
                     )
+                    pending = ""
+                elif delta:
+                    if pending:
+                        yield LLMStreamChunk(delta=pending)
+                    pending = delta
+            
+            # Stream ended without a done marker
+            if pending:
+                yield LLMStreamChunk(delta=pending)
             
             logger.info("Ollama streaming complete", model=model)
             
@@ -224,22 +309,25 @@ class OllamaClient(LLMClient):
         model = model or self.default_model
         texts = [text] if isinstance(text, str) else text
         
-        logger.debug(
-            "Ollama embedding request",
-            model=model,
-            text_count=len(texts),
-        )
+        if debug_enabled(logger):
+            logger.debug(
+                "Ollama embedding request",
+                model=model,
+                text_count=len(texts),
+            )
         
-        try:
-            embeddings = []
-            
-            for text_item in texts:
+        async def embed_one(text_item: str) -> list[float]:
+            async with self._embed_semaphore:
                 response = await self.client.embeddings(
                     model=model,
                     prompt=text_item,
                     **kwargs,
                 )
-                embeddings.append(response["embedding"])
+            return response["embedding"]
+        
+        try:
+            # Ollama embeds one prompt per request; issue them concurrently
+            embeddings = await asyncio.gather(*(embed_one(t) for t in texts))
             
             logger.info(
                 "Ollama embedding success",
@@ -265,12 +353,27 @@ class OllamaClient(LLMClient):
         Returns:
             List of model names
         """
+        return sorted(await self._models_set())
+    
+    async def has_model(self, name: str) -> bool:
+        """Check whether a model is available locally."""
+        return name in await self._models_set()
+    
+    async def _models_set(self) -> frozenset[str]:
+        """Model names, cached for models_cache_ttl seconds."""
+        cached = self._models_cache
+        if cached is not None and time.monotonic() - cached[0] < self._models_cache_ttl:
+            return cached[1]
+        
         try:
             response = await self.client.list()
-            return [model["name"] for model in response.get("models", [])]
+            names = frozenset(model.model for model in response.models if model.model)
         except Exception as e:
             logger.error("Failed to list Ollama models", error=str(e))
-            return []
+            return frozenset()
+        
+        self._models_cache = (time.monotonic(), names)
+        return names
     
     async def pull_model(self, model: str) -> bool:
         """
@@ -285,6 +388,7 @@ class OllamaClient(LLMClient):
         try:
             logger.info("Pulling Ollama model", model=model)
             await self.client.pull(model)
+            self._models_cache = None
             logger.info("Model pulled successfully", model=model)
             return True
         except Exception as e:
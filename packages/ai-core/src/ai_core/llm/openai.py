@@ -11,28 +11,52 @@ Supports:
 - Embeddings (text-embedding-3)
 """
 
-import structlog
-from typing import AsyncIterator
+import asyncio
+import os
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, Sequence
+from urllib.parse import urlparse
 
+import openai
+import structlog
 from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from openai.types import CreateEmbeddingResponse
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
+try:
+    import tiktoken
+except ImportError:  # Optional: count_tokens falls back to an estimate
+    tiktoken = None
+
+from ai_core.llm._http import get_http_client
+from ai_core.llm._ratelimit import RateLimiter
 from ai_core.llm.base import (
     LLMClient,
+    LLMMessage,
     LLMProvider,
     LLMResponse,
-    LLMMessage,
     LLMRole,
-    LLMUsage,
     LLMStreamChunk,
+    LLMUsage,
 )
+from ai_core.llm.exceptions import LLMContextLengthExceededError
 
 logger = structlog.get_logger(__name__)
 
 
-# OpenAI pricing per 1M tokens (as of Jan 2026)
+# OpenAI pricing per 1M tokens (as of Jan 2026); "cached" is the discounted
+# rate for prompt-cache hits (models without it bill cached tokens in full)
 OPENAI_PRICING = {
+    "gpt-4o": {"prompt": 2.50, "completion": 10.00, "cached": 1.25},
+    "gpt-4o-mini": {"prompt": 0.15, "completion": 0.60, "cached": 0.075},
     "gpt-4-turbo-preview": {"prompt": 10.00, "completion": 30.00},
     "gpt-4": {"prompt": 30.00, "completion": 60.00},
     "gpt-4-32k": {"prompt": 60.00, "completion": 120.00},
@@ -43,6 +67,98 @@ OPENAI_PRICING = {
     "text-embedding-ada-002": {"prompt": 0.10, "completion": 0.0},
 }
 
+# Per-token (prompt, completion, cached prompt) rates, derived once and
+# frozen so concurrent calls share one read-only table
+_RATES = MappingProxyType({
+    model: (
+        pricing["prompt"] / 1_000_000,
+        pricing["completion"] / 1_000_000,
+        pricing.get("cached", pricing["prompt"]) / 1_000_000,
+    )
+    for model, pricing in OPENAI_PRICING.items()
+})
+_FALLBACK = _RATES["gpt-4-turbo-preview"]
+
+# Embedding models bill prompt tokens only: a single per-token rate
+_EMBEDDING_MODELS = frozenset(m for m in OPENAI_PRICING if m.startswith("text-embedding-"))
+_EMBED_PRICE_PER_TOKEN = MappingProxyType(
+    {model: _RATES[model][0] for model in _EMBEDDING_MODELS}
+)
+_DEFAULT_EMBED_PRICE_PER_TOKEN = _EMBED_PRICE_PER_TOKEN["text-embedding-3-large"]
+
+# Texts longer than this (in characters) are tokenized in a worker thread
+# so a large encode doesn't block the event loop
+TOKENIZE_IN_THREAD_CHARS = 100_000
+
+# Streamed deltas are coalesced until this many characters are buffered or
+# this many milliseconds have passed, so consumers wake per batch of tokens
+STREAM_FLUSH_BYTES = int(os.getenv("LLM_STREAM_FLUSH_BYTES", "128"))
+STREAM_FLUSH_MS = float(os.getenv("LLM_STREAM_FLUSH_MS", "50"))
+
+# Embeddings endpoint limits: tokens per input and per request
+EMBED_MAX_INPUT_TOKENS = 8191
+EMBED_MAX_REQUEST_TOKENS = 300_000
+
+# Inputs per embeddings request; smaller batches run concurrently and keep
+# a transient failure from retrying the whole job
+EMBED_BATCH_SIZE = 96
+
+# Attempts per embeddings batch on rate-limit, timeout and 5xx errors
+EMBED_MAX_ATTEMPTS = 5
+
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+@lru_cache(maxsize=32)
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    """Load (once per model) the tiktoken encoding for a model."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback to cl100k_base (used by GPT-4, GPT-3.5-turbo)
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _token_batches(inputs: Sequence, token_counts: Sequence[int]) -> list[list]:
+    """Split inputs (texts or token ids) into requests within the endpoint limits."""
+    batches: list[list] = []
+    batch: list = []
+    batch_tokens = 0
+    for item, tokens in zip(inputs, token_counts, strict=True):
+        if batch and (
+            batch_tokens + tokens > EMBED_MAX_REQUEST_TOKENS
+            or len(batch) == EMBED_BATCH_SIZE
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(item)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _usage_dict(usage) -> dict:
+    """Read the counters _parse_usage needs from an SDK usage object.
+    
+    Attribute reads avoid model_dump()-ing the whole usage model.
+    """
+    if usage is None:
+        return {}
+    details = usage.prompt_tokens_details
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "prompt_tokens_details": {
+            "cached_tokens": details.cached_tokens if details else 0,
+        },
+    }
+
 
 class OpenAIClient(LLMClient):
     """
@@ -55,20 +171,62 @@ class OpenAIClient(LLMClient):
     - Structured logging
     """
     
+    _retryable_errors = LLMClient._retryable_errors + _RETRYABLE_ERRORS
+    
+    # embed() paces each request with _embed_limiter and retries it
+    _embed_paced = True
+    
     def __init__(
         self,
         api_key: str,
         model: str = "gpt-4-turbo-preview",
         base_url: str | None = None,
         organization: str | None = None,
+        max_embed_concurrency: int | None = None,
+        embed_rpm: float | None = None,
+        embed_tpm: float | None = None,
+        embed_token_ids: bool | None = None,
+        stream_usage: bool | None = None,
         **kwargs,
     ):
+        """
+        Args:
+            base_url: OpenAI-compatible endpoint (default: api.openai.com)
+            embed_token_ids: Tokenize embedding inputs locally, check them
+                against OpenAI's per-input limit and send token ids instead
+                of text; defaults to on for api.openai.com only, since many
+                compatible servers reject token input
+            stream_usage: Request a trailing usage chunk on streams
+                (stream_options.include_usage); defaults to on for
+                api.openai.com only, since some compatible servers return
+                400 for it
+        """
         super().__init__(api_key=api_key, model=model, **kwargs)
         
         self.client = AsyncOpenAI(
             api_key=api_key,
             base_url=base_url,
             organization=organization,
+            http_client=get_http_client(),
+        )
+        
+        # Resolved by the SDK (argument, OPENAI_BASE_URL or the default);
+        # OpenAI-only request features are gated on it
+        self.base_url = str(self.client.base_url)
+        self._official_endpoint = urlparse(self.base_url).hostname == "api.openai.com"
+        self.embed_token_ids = (
+            self._official_endpoint if embed_token_ids is None else embed_token_ids
+        )
+        self.stream_usage = self._official_endpoint if stream_usage is None else stream_usage
+        
+        # Bounds concurrent requests when embedding in several batches
+        self._embed_semaphore = asyncio.Semaphore(
+            max_embed_concurrency or int(os.getenv("OPENAI_EMBED_CONCURRENCY", "8"))
+        )
+        # Paces embedding batches to the account's rate limits
+        self._embed_limiter = RateLimiter(
+            rpm=embed_rpm or float(os.getenv("OPENAI_EMBED_RPM", "3000")),
+            tpm=embed_tpm or float(os.getenv("OPENAI_EMBED_TPM", "1000000")),
         )
         
         logger.info(
@@ -93,15 +251,18 @@ class OpenAIClient(LLMClient):
         if isinstance(prompt, str):
             return [{"role": "user", "content": prompt}]
         
-        return [
-            {
-                "role": msg.role.value,
-                "content": msg.content,
-                **({"name": msg.name} if msg.name else {}),
-                **({"function_call": msg.function_call} if msg.function_call else {}),
-            }
-            for msg in prompt
-        ]
+        # Optional keys are assigned directly rather than merged from
+        # temporary dicts; long agent traces convert hundreds of messages
+        messages = []
+        append = messages.append
+        for msg in prompt:
+            message = {"role": msg.role.value, "content": msg.content}
+            if msg.name:
+                message["name"] = msg.name
+            if msg.function_call:
+                message["function_call"] = msg.function_call
+            append(message)
+        return messages
     
     def _parse_usage(
         self,
@@ -112,12 +273,15 @@ class OpenAIClient(LLMClient):
         prompt_tokens = usage.get("prompt_tokens", 0)
         completion_tokens = usage.get("completion_tokens", 0)
         
-        # Get pricing for model (fallback to gpt-4-turbo)
-        pricing = OPENAI_PRICING.get(model, OPENAI_PRICING["gpt-4-turbo-preview"])
+        # Get per-token pricing for model (fallback to gpt-4-turbo)
+        prompt_rate, completion_rate, cached_rate = _RATES.get(model, _FALLBACK)
         
-        # Calculate cost (pricing is per 1M tokens)
-        prompt_cost = (prompt_tokens / 1_000_000) * pricing["prompt"]
-        completion_cost = (completion_tokens / 1_000_000) * pricing["completion"]
+        # Prompt-cache hits are a subset of prompt tokens, billed at a discount
+        cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        cached_cost = cached_tokens * cached_rate
+        
+        prompt_cost = (prompt_tokens - cached_tokens) * prompt_rate + cached_cost
+        completion_cost = completion_tokens * completion_rate
         
         return LLMUsage(
             prompt_tokens=prompt_tokens,
@@ -126,6 +290,8 @@ class OpenAIClient(LLMClient):
             prompt_cost=prompt_cost,
             completion_cost=completion_cost,
             total_cost=prompt_cost + completion_cost,
+            cached_tokens=cached_tokens,
+            cached_cost=cached_cost,
         )
     
     async def complete(
@@ -162,7 +328,7 @@ class OpenAIClient(LLMClient):
             content = choice.message.content or ""
             
             usage = self._parse_usage(
-                response.usage.model_dump() if response.usage else {},
+                _usage_dict(response.usage),
                 model=model,
             )
             
@@ -179,7 +345,7 @@ class OpenAIClient(LLMClient):
                 provider=self.provider,
                 usage=usage,
                 finish_reason=choice.finish_reason,
-                raw_response=response.model_dump(),
+                raw_response=response,
                 function_call=choice.message.function_call.model_dump() if choice.message.function_call else None,
                 tool_calls=[tc.model_dump() for tc in choice.message.tool_calls] if choice.message.tool_calls else [],
             )
@@ -201,7 +367,7 @@ class OpenAIClient(LLMClient):
         max_tokens: int | None = None,
         **kwargs,
     ) -> AsyncIterator[LLMStreamChunk]:
-        """Stream completion token-by-token."""
+        """Stream completion, coalescing small token deltas."""
         model = model or self.default_model
         messages = self._convert_messages(prompt)
         
@@ -211,6 +377,10 @@ class OpenAIClient(LLMClient):
             message_count=len(messages),
         )
         
+        # Ask for a trailing usage-only chunk (empty choices)
+        if self.stream_usage:
+            kwargs.setdefault("stream_options", {"include_usage": True})
+        
         try:
             stream = await self.client.chat.completions.create(
                 model=model,
@@ -221,7 +391,20 @@ class OpenAIClient(LLMClient):
                 **kwargs,
             )
             
+            finish_reason = None
+            usage = None
+            
+            # Pending deltas, flushed by size, age or finish reason
+            buf: list[str] = []
+            buf_len = 0
+            flush_interval = STREAM_FLUSH_MS / 1000
+            last_flush = time.monotonic()
+            
             async for chunk in stream:
+                chunk_usage = getattr(chunk, "usage", None)
+                if chunk_usage:
+                    usage = self._parse_usage(_usage_dict(chunk_usage), model=model)
+                
                 if not chunk.choices:
                     continue
                 
@@ -229,25 +412,34 @@ class OpenAIClient(LLMClient):
                 delta = choice.delta.content or ""
                 
                 if delta:
-                    yield LLMStreamChunk(
-                        delta=delta,
-                        finish_reason=choice.finish_reason,
-                    )
+                    buf.append(delta)
+                    buf_len += len(delta)
                 
-                # Last chunk includes usage (if available)
                 if choice.finish_reason:
-                    usage = None
-                    if hasattr(chunk, "usage") and chunk.usage:
-                        usage = self._parse_usage(
-                            chunk.usage.model_dump(),
-                            model=model,
-                        )
-                    
-                    yield LLMStreamChunk(
-                        delta="",
-                        finish_reason=choice.finish_reason,
-                        usage=usage,
-                    )
+                    finish_reason = choice.finish_reason
+                
+                if buf and (
+                    choice.finish_reason
+                    or buf_len >= STREAM_FLUSH_BYTES
+                    or time.monotonic() - last_flush >= flush_interval
+                ):
+                    # finish_reason goes on the final chunk only, with usage
+                    yield LLMStreamChunk(delta="".join(buf))
+                    buf.clear()
+                    buf_len = 0
+                    last_flush = time.monotonic()
+            
+            # Stream ended without a finish reason: don't drop buffered text
+            if buf:
+                yield LLMStreamChunk(delta="".join(buf))
+            
+            # Final chunk carries usage, which arrives after the finish reason
+            if finish_reason or usage:
+                yield LLMStreamChunk(
+                    delta="",
+                    finish_reason=finish_reason,
+                    usage=usage,
+                )
             
             logger.info("OpenAI streaming complete", model=model)
             
@@ -276,26 +468,53 @@ class OpenAIClient(LLMClient):
         )
         
         try:
-            response: CreateEmbeddingResponse = await self.client.embeddings.create(
-                model=model,
-                input=texts,
-                **kwargs,
-            )
+            if tiktoken is None or not self.embed_token_ids:
+                # Other OpenAI-compatible servers have their own tokenizers
+                # and limits, so leave length checks to them
+                batches: list[list] = [
+                    texts[i:i + EMBED_BATCH_SIZE]
+                    for i in range(0, len(texts), EMBED_BATCH_SIZE)
+                ]
+            else:
+                # Tokenize locally (tiktoken releases the GIL across threads)
+                # to validate lengths before any request
+                encoding = _get_encoding(model)
+                token_lists = await asyncio.to_thread(
+                    encoding.encode_batch,
+                    texts,
+                    num_threads=os.cpu_count() or 1,
+                    disallowed_special=(),
+                )
+                token_counts = [len(tokens) for tokens in token_lists]
+                for index, count in enumerate(token_counts):
+                    if count > EMBED_MAX_INPUT_TOKENS:
+                        raise LLMContextLengthExceededError(
+                            f"Input {index} has {count} tokens; "
+                            f"the limit is {EMBED_MAX_INPUT_TOKENS}",
+                            provider="openai",
+                            model=model,
+                        )
+                # Token ids save the server a tokenize pass
+                batches = _token_batches(token_lists, token_counts)
             
-            embeddings = [item.embedding for item in response.data]
+            responses = await asyncio.gather(*(
+                self._embed_batch(batch, model, **kwargs) for batch in batches
+            ))
             
-            # Calculate cost
-            usage = self._parse_usage(
-                {"prompt_tokens": response.usage.prompt_tokens, "completion_tokens": 0},
-                model=model,
-            )
+            embeddings = [
+                item.embedding for response in responses for item in response.data
+            ]
+            
+            # Cost is only logged, so skip building an LLMUsage
+            prompt_tokens = sum(r.usage.prompt_tokens for r in responses)
+            cost = prompt_tokens * _EMBED_PRICE_PER_TOKEN.get(model, _DEFAULT_EMBED_PRICE_PER_TOKEN)
             
             logger.info(
                 "OpenAI embedding success",
                 model=model,
                 text_count=len(texts),
                 embedding_dim=len(embeddings[0]) if embeddings else 0,
-                cost=usage.total_cost,
+                cost=cost,
             )
             
             return embeddings
@@ -308,26 +527,45 @@ class OpenAIClient(LLMClient):
             )
             raise
     
+    async def _embed_batch(
+        self,
+        inputs: list[str] | list[list[int]],
+        model: str,
+        **kwargs,
+    ) -> CreateEmbeddingResponse:
+        """Send one embeddings request (texts or token id lists), with retries."""
+        if inputs and isinstance(inputs[0], str):
+            tokens = sum(len(text.encode("utf-8")) for text in inputs) // 4
+        else:
+            tokens = sum(len(token_ids) for token_ids in inputs)
+        
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+            stop=stop_after_attempt(EMBED_MAX_ATTEMPTS),
+            wait=wait_exponential_jitter(initial=1, max=30),
+            reraise=True,
+        ):
+            with attempt:
+                await self._embed_limiter.acquire(tokens)
+                async with self._embed_semaphore:
+                    return await self.client.embeddings.create(
+                        model=model,
+                        input=inputs,
+                        **kwargs,
+                    )
+    
     async def count_tokens(
         self,
         text: str,
         model: str | None = None,
     ) -> int:
         """Count tokens using tiktoken."""
-        try:
-            import tiktoken
-            
-            model = model or self.default_model
-            
-            # Get encoding for model
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
-                # Fallback to cl100k_base (used by GPT-4, GPT-3.5-turbo)
-                encoding = tiktoken.get_encoding("cl100k_base")
-            
-            return len(encoding.encode(text))
-            
-        except ImportError:
+        if tiktoken is None:
             # Fallback to rough approximation
             return await super().count_tokens(text, model)
+        
+        encoding = _get_encoding(model or self.default_model)
+        
+        if len(text) > TOKENIZE_IN_THREAD_CHARS:
+            return len(await asyncio.to_thread(encoding.encode, text))
+        return len(encoding.encode(text))
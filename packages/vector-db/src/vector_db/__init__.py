@@ -17,14 +17,17 @@ Usage:
     results = await store.search(query_vector=query_emb, top_k=10)
 """
 
-from vector_db.base import VectorStore, SearchResult, VectorMetadata
-from vector_db.factory import get_vector_store
+from vector_db.base import VectorStore, BaseVectorStore, SearchResult, VectorMetadata, QuantizationMode
+from vector_db.factory import get_vector_store, aclose_all
 
 __version__ = "0.1.0"
 
 __all__ = [
     "VectorStore",
+    "BaseVectorStore",
     "SearchResult",
     "VectorMetadata",
+    "QuantizationMode",
     "get_vector_store",
+    "aclose_all",
 ]
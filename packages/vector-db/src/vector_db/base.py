@@ -1,7 +1,7 @@
 """
 Vector DB - Base Interface
 ==========================
-Abstract base class for vector database implementations.
+Vector store protocol and shared base implementation.
 
 Following SOLID principles from GEMINI.md:
 - Single Responsibility: Each store handles one vector DB
@@ -11,14 +11,17 @@ Following SOLID principles from GEMINI.md:
 - Dependency Inversion: Depend on abstractions, not concrete implementations
 """
 
-from abc import ABC, abstractmethod
+import time
 from datetime import datetime, UTC
 from enum import Enum
-from typing import Any, Literal
+from typing import Any, Literal, Protocol, runtime_checkable
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic_core import to_json
 import numpy as np
 
+from vector_db.exceptions import InvalidVectorDimensionError
+
 
 class VectorDBProvider(str, Enum):
     """Supported vector database providers."""
@@ -26,6 +29,7 @@ class VectorDBProvider(str, Enum):
     WEAVIATE = "weaviate"
     PGVECTOR = "pgvector"
     MILVUS = "milvus"
+    CUVS = "cuvs"
 
 
 class DistanceMetric(str, Enum):
@@ -36,6 +40,39 @@ class DistanceMetric(str, Enum):
     MANHATTAN = "manhattan"
 
 
+class QuantizationMode(str, Enum):
+    """
+    Vector quantization applied by the database.
+    
+    INT8 stores 1 byte per dimension (4x smaller than float32), BINARY
+    1 bit (32x smaller); full-precision vectors are kept for rescoring.
+    """
+    NONE = "none"
+    INT8 = "int8"
+    BINARY = "binary"
+
+
+# (time.time(), datetime) of the last _now_utc() computation
+_now_cache: tuple[float, datetime | None] = (0.0, None)
+
+
+def _now_utc() -> datetime:
+    """
+    Current UTC time, reused for up to 50 ms.
+    
+    Bulk indexing builds metadata objects in tight loops; sharing one
+    datetime per window skips the tz-aware construction per field.
+    """
+    global _now_cache
+    now = time.time()
+    cached_at, cached = _now_cache
+    if cached is not None and now - cached_at < 0.05:
+        return cached
+    cached = datetime.fromtimestamp(now, UTC)
+    _now_cache = (now, cached)
+    return cached
+
+
 class VectorMetadata(BaseModel):
     """
     Metadata attached to vectors.
@@ -57,39 +94,75 @@ class VectorMetadata(BaseModel):
     tags: list[str] = Field(default_factory=list)
     
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=_now_utc)
+    updated_at: datetime = Field(default_factory=_now_utc)
     
     # Custom metadata
     extras: dict[str, Any] = Field(default_factory=dict)
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to flat dictionary for vector DB storage."""
-        data = self.model_dump()
-        # Merge extras into top level
-        extras = data.pop("extras", {})
-        data.update(extras)
-        # Convert datetime to ISO string
-        data["created_at"] = data["created_at"].isoformat()
-        data["updated_at"] = data["updated_at"].isoformat()
-        return data
+        # JSON mode serializes datetimes to ISO strings in the Rust core
+        return _flatten_extras(self.model_dump(mode="json"))
+    
+    def to_json(self) -> bytes:
+        """Serialize the flat storage form to JSON bytes."""
+        return to_json(self.to_dict())
+    
+    @staticmethod
+    def batch_to_dicts(items: list["VectorMetadata"]) -> list[dict[str, Any]]:
+        """Convert many metadata objects with a single serializer call."""
+        return [
+            _flatten_extras(data)
+            for data in _METADATA_LIST_ADAPTER.dump_python(items, mode="json")
+        ]
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "VectorMetadata":
         """Create from flat dictionary."""
         # Extract known fields
-        known_fields = set(cls.model_fields.keys())
-        known_data = {k: v for k, v in data.items() if k in known_fields}
-        extras_data = {k: v for k, v in data.items() if k not in known_fields}
+        known_data = {k: v for k, v in data.items() if k in _KNOWN_FIELDS}
+        extras_data = {k: v for k, v in data.items() if k not in _KNOWN_FIELDS}
+        
+        # ISO timestamp strings are parsed by pydantic-core validation
+        known_data["extras"] = extras_data
+        return cls.model_validate(known_data)
+    
+    @classmethod
+    def from_storage(cls, data: dict[str, Any]) -> "VectorMetadata":
+        """
+        Rebuild metadata read back from a vector store, skipping validation.
+        
+        Stored payloads were produced by to_dict(), so only the ISO
+        timestamps need parsing; used when building search results.
+        """
+        known_data = {}
+        extras_data = {}
+        for key, value in data.items():
+            if key in _KNOWN_FIELDS:
+                known_data[key] = value
+            else:
+                extras_data[key] = value
         
-        # Parse timestamps
-        if "created_at" in known_data and isinstance(known_data["created_at"], str):
-            known_data["created_at"] = datetime.fromisoformat(known_data["created_at"])
-        if "updated_at" in known_data and isinstance(known_data["updated_at"], str):
-            known_data["updated_at"] = datetime.fromisoformat(known_data["updated_at"])
+        for key in ("created_at", "updated_at"):
+            value = known_data.get(key)
+            if isinstance(value, str):
+                known_data[key] = datetime.fromisoformat(value)
         
         known_data["extras"] = extras_data
-        return cls(**known_data)
+        return cls.model_construct(**known_data)
+
+
+_KNOWN_FIELDS = frozenset(VectorMetadata.model_fields)
+_METADATA_LIST_ADAPTER = TypeAdapter(list[VectorMetadata])
+
+
+def _flatten_extras(data: dict[str, Any]) -> dict[str, Any]:
+    """Merge the extras dict of dumped metadata into the top level."""
+    extras = data.pop("extras", None)
+    if extras:
+        data.update(extras)
+    return data
 
 
 class SearchResult(BaseModel):
@@ -114,9 +187,10 @@ class SearchResult(BaseModel):
         arbitrary_types_allowed = True
 
 
-class VectorStore(ABC):
+@runtime_checkable
+class VectorStore(Protocol):
     """
-    Abstract base class for vector database implementations.
+    Interface for vector database implementations.
     
     All vector stores must implement this interface.
     Ensures consistent API regardless of underlying database.
@@ -126,36 +200,21 @@ class VectorStore(ABC):
     - Type-safe with Pydantic models
     - Observable with rich metadata
     - Scalable with batch operations
+    
+    A structural Protocol (no ABC metaclass): any object with these members
+    is a VectorStore, and isinstance() checks work via runtime_checkable.
+    Concrete stores normally subclass BaseVectorStore for shared behavior.
     """
     
-    def __init__(
-        self,
-        collection_name: str,
-        dimension: int,
-        distance_metric: DistanceMetric = DistanceMetric.COSINE,
-        **kwargs,
-    ):
-        """
-        Initialize vector store.
-        
-        Args:
-            collection_name: Name of the collection/index
-            dimension: Embedding dimension (e.g., 1536 for OpenAI)
-            distance_metric: Similarity metric to use
-            **kwargs: Provider-specific configuration
-        """
-        self.collection_name = collection_name
-        self.dimension = dimension
-        self.distance_metric = distance_metric
-        self.config = kwargs
+    collection_name: str
+    dimension: int
+    distance_metric: DistanceMetric
     
     @property
-    @abstractmethod
     def provider(self) -> VectorDBProvider:
         """Return the provider identifier."""
         ...
     
-    @abstractmethod
     async def create_collection(self) -> bool:
         """
         Create the collection/index if it doesn't exist.
@@ -165,7 +224,6 @@ class VectorStore(ABC):
         """
         ...
     
-    @abstractmethod
     async def delete_collection(self) -> bool:
         """
         Delete the collection/index.
@@ -175,7 +233,6 @@ class VectorStore(ABC):
         """
         ...
     
-    @abstractmethod
     async def collection_exists(self) -> bool:
         """
         Check if collection exists.
@@ -185,7 +242,6 @@ class VectorStore(ABC):
         """
         ...
     
-    @abstractmethod
     async def upsert(
         self,
         vectors: list[list[float]] | np.ndarray,
@@ -196,7 +252,8 @@ class VectorStore(ABC):
         Insert or update vectors.
         
         Args:
-            vectors: List of embedding vectors
+            vectors: Embedding vectors, preferably a C-contiguous float32
+                ndarray of shape (N, dimension); lists are converted once
             metadata: List of metadata objects (one per vector)
             ids: List of unique IDs (one per vector)
         
@@ -215,7 +272,6 @@ class VectorStore(ABC):
         """
         ...
     
-    @abstractmethod
     async def search(
         self,
         query_vector: list[float] | np.ndarray,
@@ -244,7 +300,6 @@ class VectorStore(ABC):
         """
         ...
     
-    @abstractmethod
     async def delete(
         self,
         ids: list[str] | None = None,
@@ -269,7 +324,6 @@ class VectorStore(ABC):
         """
         ...
     
-    @abstractmethod
     async def get(
         self,
         ids: list[str],
@@ -287,6 +341,117 @@ class VectorStore(ABC):
         """
         ...
     
+    async def count(self, filters: dict[str, Any] | None = None) -> int:
+        """Count vectors in collection (optionally a filtered subset)."""
+        ...
+    
+    async def close(self) -> None:
+        """Release the client connection pool."""
+        ...
+    
+    async def health_check(self) -> bool:
+        """Check if the vector database is available."""
+        ...
+
+
+class BaseVectorStore:
+    """
+    Shared implementation for vector stores.
+    
+    Holds the common configuration and vector coercion helpers, and
+    provides defaults for count(), close() and health_check(). Subclasses
+    implement the rest of the VectorStore protocol.
+    """
+    
+    def __init__(
+        self,
+        collection_name: str,
+        dimension: int,
+        distance_metric: DistanceMetric = DistanceMetric.COSINE,
+        quantization: QuantizationMode = QuantizationMode.NONE,
+        **kwargs,
+    ):
+        """
+        Initialize vector store.
+        
+        Args:
+            collection_name: Name of the collection/index
+            dimension: Embedding dimension (e.g., 1536 for OpenAI)
+            distance_metric: Similarity metric to use
+            quantization: Index quantization (where the provider supports it)
+            **kwargs: Provider-specific configuration
+        """
+        self.collection_name = collection_name
+        self.dimension = dimension
+        self.distance_metric = distance_metric
+        self.quantization = QuantizationMode(quantization)
+        self.config = kwargs
+    
+    @staticmethod
+    def _check_batch_lengths(
+        vectors: list[list[float]] | np.ndarray,
+        metadata: list[VectorMetadata],
+        ids: list[str],
+    ) -> int:
+        """
+        Check that an upsert batch is aligned and return its size.
+        
+        Raises:
+            ValueError: If vectors, metadata and ids differ in length
+        """
+        n = len(ids)
+        if not (len(vectors) == len(metadata) == n):
+            raise ValueError(
+                "vectors, metadata, and ids must have the same length: "
+                f"vectors={len(vectors)}, metadata={len(metadata)}, ids={n}"
+            )
+        return n
+    
+    def _as_f32_matrix(self, vectors: list[list[float]] | np.ndarray) -> np.ndarray:
+        """
+        Coerce vectors to a C-contiguous (N, dimension) float32 array.
+        
+        A single shape check replaces per-row length checks.
+        
+        Raises:
+            InvalidVectorDimensionError: If vectors are ragged or the wrong size
+        """
+        if len(vectors) == 0:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        
+        try:
+            matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+        except ValueError as e:
+            raise InvalidVectorDimensionError(
+                f"Vectors must all have dimension {self.dimension}: {e}",
+                provider=self.provider.value,
+                collection=self.collection_name,
+            ) from e
+        
+        if matrix.ndim != 2 or matrix.shape[1] != self.dimension:
+            raise InvalidVectorDimensionError(
+                f"Expected vectors of shape (N, {self.dimension}), got {matrix.shape}",
+                provider=self.provider.value,
+                collection=self.collection_name,
+            )
+        return matrix
+    
+    def _as_f32_vector(self, vector: list[float] | np.ndarray) -> np.ndarray:
+        """
+        Coerce a query vector to a contiguous float32 array of length dimension.
+        
+        Raises:
+            InvalidVectorDimensionError: If the vector is the wrong size
+        """
+        array = np.ascontiguousarray(vector, dtype=np.float32)
+        if array.shape != (self.dimension,):
+            raise InvalidVectorDimensionError(
+                f"Expected query vector of shape ({self.dimension},), got {array.shape}",
+                provider=self.provider.value,
+                collection=self.collection_name,
+            )
+        return array
+    
     async def count(self, filters: dict[str, Any] | None = None) -> int:
         """
         Count vectors in collection.
@@ -299,6 +464,13 @@ class VectorStore(ABC):
         """
         raise NotImplementedError(f"{self.provider} does not implement count()")
     
+    async def close(self) -> None:
+        """
+        Release the client connection pool.
+        
+        Default is a no-op; stores owning connections override it.
+        """
+    
     async def health_check(self) -> bool:
         """
         Check if the vector database is available.
@@ -4,8 +4,8 @@ Vector DB - Factory
 Factory pattern for creating vector store clients.
 """
 
+import asyncio
 import os
-from functools import lru_cache
 from typing import Literal
 
 import structlog
@@ -14,11 +14,12 @@ from vector_db.base import VectorStore, VectorDBProvider, DistanceMetric
 from vector_db.stores.qdrant import QdrantStore
 from vector_db.stores.weaviate import WeaviateStore
 from vector_db.stores.pgvector import PgVectorStore
+from vector_db.stores.cuvs import CuvsStore
 from vector_db.exceptions import VectorDBError
 
 logger = structlog.get_logger(__name__)
 
-VectorDBProviderType = Literal["qdrant", "weaviate", "pgvector"]
+VectorDBProviderType = Literal["qdrant", "weaviate", "pgvector", "cuvs"]
 
 
 def get_vector_store(
@@ -32,7 +33,7 @@ def get_vector_store(
     Factory function to get the appropriate vector store.
     
     Args:
-        provider: Vector DB provider (qdrant, weaviate, pgvector)
+        provider: Vector DB provider (qdrant, weaviate, pgvector, cuvs)
                  If None, reads from VECTOR_DB_PROVIDER env var
         collection_name: Collection/index name
                         If None, reads from QDRANT_COLLECTION_NAME or similar
@@ -70,6 +71,9 @@ def get_vector_store(
         # pgvector
         DATABASE_URL: PostgreSQL connection string
         PGVECTOR_COLLECTION_NAME: Table name
+        
+        # cuVS (in-process GPU index)
+        CUVS_COLLECTION_NAME: Index name
     """
     # Get provider from argument or environment
     provider = provider or os.getenv("VECTOR_DB_PROVIDER", "qdrant")
@@ -82,6 +86,8 @@ def get_vector_store(
             collection_name = os.getenv("WEAVIATE_COLLECTION_NAME", "Documents")
         elif provider == "pgvector":
             collection_name = os.getenv("PGVECTOR_COLLECTION_NAME", "embeddings")
+        elif provider == "cuvs":
+            collection_name = os.getenv("CUVS_COLLECTION_NAME", "embeddings")
     
     # Get dimension (default to OpenAI's text-embedding-3-large dimension)
     if dimension is None:
@@ -94,6 +100,65 @@ def get_vector_store(
         dimension=dimension,
     )
     
+    try:
+        cfg_key = frozenset(kwargs.items())
+        hash(cfg_key)
+    except TypeError:
+        # Unhashable provider options: build an uncached store
+        return _create_vector_store(provider, collection_name, dimension, distance_metric, **kwargs)
+    
+    return _get_cached_store(provider, collection_name, dimension, distance_metric, cfg_key)
+
+
+# Cached stores by resolved configuration. Never evicted: callers keep
+# using the stores they were handed, so they stay open until aclose_all()
+_cached_stores: dict[tuple, VectorStore] = {}
+
+
+def _get_cached_store(
+    provider: str,
+    collection_name: str,
+    dimension: int,
+    distance_metric: DistanceMetric,
+    cfg_key: frozenset,
+) -> VectorStore:
+    """
+    Get or create a cached vector store.
+    
+    Callers with the same resolved configuration share one store and its
+    connection pool.
+    """
+    key = (provider, collection_name, dimension, distance_metric, cfg_key)
+    store = _cached_stores.get(key)
+    if store is None:
+        store = _cached_stores[key] = _create_vector_store(
+            provider, collection_name, dimension, distance_metric, **dict(cfg_key)
+        )
+    return store
+
+
+async def aclose_all() -> None:
+    """
+    Close all cached vector stores and clear the cache.
+    
+    Call on application shutdown to release connection pools.
+    """
+    stores = list(_cached_stores.values())
+    _cached_stores.clear()
+    await asyncio.gather(*(store.close() for store in stores), return_exceptions=True)
+    
+    # Weaviate clients are shared across stores and closed separately
+    WeaviateStore.shutdown()
+
+
+def _create_vector_store(
+    provider: str,
+    collection_name: str,
+    dimension: int,
+    distance_metric: DistanceMetric,
+    **kwargs,
+) -> VectorStore:
+    """Instantiate the store class for a provider."""
     if provider == "qdrant":
         url = kwargs.pop("url", os.getenv("QDRANT_URL", "http://localhost:6333"))
         api_key = kwargs.pop("api_key", os.getenv("QDRANT_API_KEY"))
@@ -134,6 +199,14 @@ def get_vector_store(
             **kwargs,
         )
     
+    elif provider == "cuvs":
+        return CuvsStore(
+            collection_name=collection_name,
+            dimension=dimension,
+            distance_metric=distance_metric,
+            **kwargs,
+        )
+    
     else:
         raise VectorDBError(f"Unknown provider: {provider}", provider=provider)
 
@@ -7,9 +7,11 @@ Vector store implementations.
 from vector_db.stores.qdrant import QdrantStore
 from vector_db.stores.weaviate import WeaviateStore
 from vector_db.stores.pgvector import PgVectorStore
+from vector_db.stores.cuvs import CuvsStore
 
 __all__ = [
     "QdrantStore",
     "WeaviateStore",
-    "Pg VectorStore",
+    "PgVectorStore",
+    "CuvsStore",
 ]
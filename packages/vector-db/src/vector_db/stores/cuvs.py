@@ -0,0 +1,426 @@
+"""
+Vector DB - cuVS Client
+=======================
+In-process GPU vector index using NVIDIA cuVS IVF-PQ.
+
+Features:
+- GPU approximate search (IVF coarse quantizer + product quantization)
+- PQ codes held in GPU memory; full vectors kept on host for exact reranking
+- Exact host-side search until there is enough data to train the index
+- Same VectorStore interface as the server-backed stores
+
+Data lives in process memory only: nothing is persisted across restarts.
+Intended for large (10M+) read-heavy collections rebuilt from a source of truth.
+"""
+
+import asyncio
+from typing import Any
+
+import numpy as np
+import structlog
+
+try:
+    import cupy
+    from cuvs.neighbors import ivf_pq
+except ImportError:  # Optional: requires a CUDA GPU (pip install vector-db[gpu])
+    cupy = None
+    ivf_pq = None
+
+from vector_db.base import (
+    BaseVectorStore,
+    DistanceMetric,
+    SearchResult,
+    VectorDBProvider,
+    VectorMetadata,
+)
+from vector_db.exceptions import VectorDBError
+
+logger = structlog.get_logger(__name__)
+
+
+# Map our distance metrics to cuVS's; cosine searches normalized vectors
+# by inner product
+METRIC_MAP = {
+    DistanceMetric.COSINE: "inner_product",
+    DistanceMetric.DOT_PRODUCT: "inner_product",
+    DistanceMetric.EUCLIDEAN: "sqeuclidean",
+}
+
+
+class CuvsStore(BaseVectorStore):
+    """
+    cuVS IVF-PQ vector index on the GPU.
+    
+    Until min_train_rows rows exist, searches are exact brute force on the
+    host. The index is then trained on all rows, extended by later upserts,
+    and retrained once the row count grows by rebuild_growth, so centroids
+    and PQ codebooks track the data. Updated and deleted rows are tombstoned
+    on the host and skipped in results.
+    """
+    
+    def __init__(
+        self,
+        collection_name: str,
+        dimension: int,
+        distance_metric: DistanceMetric = DistanceMetric.COSINE,
+        n_lists: int = 1024,
+        pq_dim: int | None = None,
+        pq_bits: int = 8,
+        n_probes: int = 50,
+        refine_ratio: int = 2,
+        min_train_rows: int | None = None,
+        rebuild_growth: float = 2.0,
+        **kwargs,
+    ):
+        """
+        Args:
+            n_lists: IVF clusters (capped at the size of the first upsert)
+            pq_dim: PQ sub-quantizers per vector (default dimension // 4)
+            pq_bits: Bits per PQ code
+            n_probes: Clusters scanned per query
+            refine_ratio: Candidates fetched per result and reranked exactly
+                on the host; 1 disables reranking
+            min_train_rows: Rows needed before the index is trained
+                (default 40 per IVF list); searches are exact until then
+            rebuild_growth: Retrain the index from scratch when the row
+                count reaches this multiple of the count it was trained on
+        """
+        if ivf_pq is None:
+            raise VectorDBError(
+                "CuvsStore requires the cuvs and cupy packages and a CUDA GPU",
+                provider=VectorDBProvider.CUVS.value,
+                collection=collection_name,
+            )
+        if distance_metric not in METRIC_MAP:
+            raise VectorDBError(
+                f"cuVS IVF-PQ does not support {distance_metric.value} distance",
+                provider=VectorDBProvider.CUVS.value,
+                collection=collection_name,
+            )
+        
+        super().__init__(collection_name, dimension, distance_metric, **kwargs)
+        
+        self.n_lists = n_lists
+        self.pq_dim = pq_dim or dimension // 4
+        self.pq_bits = pq_bits
+        self.n_probes = n_probes
+        self.refine_ratio = max(1, refine_ratio)
+        self.min_train_rows = min_train_rows or n_lists * 40
+        self.rebuild_growth = rebuild_growth
+        
+        self._index = None
+        self._created = False
+        self._lock = asyncio.Lock()
+        self._reset()
+        
+        logger.info(
+            "cuVS store initialized",
+            collection=collection_name,
+            dimension=dimension,
+            n_lists=n_lists,
+            pq_dim=self.pq_dim,
+        )
+    
+    def _reset(self) -> None:
+        """Drop the index and all host-side rows."""
+        self._index = None
+        # Row count the current index was trained on
+        self._trained_rows = 0
+        # Row position -> ID / payload / live flag; vectors hold all rows
+        self._vectors = np.empty((0, self.dimension), dtype=np.float32)
+        self._ids: list[str] = []
+        self._payloads: list[dict[str, Any]] = []
+        self._live = np.empty(0, dtype=bool)
+        self._rows: dict[str, int] = {}
+    
+    @property
+    def provider(self) -> VectorDBProvider:
+        return VectorDBProvider.CUVS
+    
+    async def close(self) -> None:
+        """Release the GPU index."""
+        async with self._lock:
+            self._reset()
+    
+    async def create_collection(self) -> bool:
+        """Start an empty index; it is built on the first upsert."""
+        if self._created:
+            logger.info("Collection already exists", collection=self.collection_name)
+            return False
+        
+        self._created = True
+        logger.info("Collection created", collection=self.collection_name)
+        return True
+    
+    async def delete_collection(self) -> bool:
+        """Drop the index and all stored rows."""
+        async with self._lock:
+            self._reset()
+            self._created = False
+        logger.info("Collection deleted", collection=self.collection_name)
+        return True
+    
+    async def collection_exists(self) -> bool:
+        """Check if collection exists."""
+        return self._created
+    
+    async def upsert(
+        self,
+        vectors: list[list[float]] | np.ndarray,
+        metadata: list[VectorMetadata],
+        ids: list[str],
+    ) -> int:
+        """Insert or update vectors in the GPU index."""
+        n = self._check_batch_lengths(vectors, metadata, ids)
+        
+        vectors = self._prepare(self._as_f32_matrix(vectors))
+        
+        logger.debug(
+            "Upserting vectors",
+            collection=self.collection_name,
+            count=n,
+        )
+        
+        try:
+            payloads = VectorMetadata.batch_to_dicts(metadata)
+            
+            async with self._lock:
+                start = len(self._ids)
+                positions = np.arange(start, start + n, dtype=np.int64)
+                all_vectors = np.concatenate([self._vectors, vectors])
+                total = len(all_vectors)
+                
+                # GPU work blocks; run it off the event loop. Host state is
+                # only updated once it succeeds, so both stay in step
+                trained_rows = self._trained_rows
+                if self._index is not None and total < trained_rows * self.rebuild_growth:
+                    index = await asyncio.to_thread(self._extend_index, vectors, positions)
+                elif total >= self.min_train_rows:
+                    index = await asyncio.to_thread(self._build_index, all_vectors)
+                    trained_rows = total
+                else:
+                    index = None
+                
+                self._index = index
+                self._trained_rows = trained_rows
+                self._vectors = all_vectors
+                self._ids.extend(ids)
+                self._payloads.extend(payloads)
+                self._live = np.concatenate([self._live, np.ones(n, dtype=bool)])
+                
+                # Updated IDs get a new row; the old one is tombstoned
+                for idx, position in zip(ids, positions.tolist(), strict=True):
+                    old = self._rows.get(idx)
+                    if old is not None:
+                        self._live[old] = False
+                    self._rows[idx] = position
+            
+            logger.info(
+                "Vectors upserted",
+                collection=self.collection_name,
+                count=n,
+            )
+            
+            return n
+        
+        except Exception as e:
+            logger.error(
+                "Failed to upsert vectors",
+                collection=self.collection_name,
+                error=str(e),
+            )
+            raise
+    
+    async def search(
+        self,
+        query_vector: list[float] | np.ndarray,
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+        include_vector: bool = False,
+    ) -> list[SearchResult]:
+        """Search the GPU index (or all rows before it is trained), then rerank exactly."""
+        query_vector = self._prepare(self._as_f32_vector(query_vector)[None, :])
+        
+        logger.debug(
+            "Searching vectors",
+            collection=self.collection_name,
+            top_k=top_k,
+            has_filters=filters is not None,
+        )
+        
+        try:
+            # Upserts swap the index and host arrays together; hold the lock
+            # so a search never mixes them
+            async with self._lock:
+                return await self._search_locked(query_vector, top_k, filters, include_vector)
+        
+        except Exception as e:
+            logger.error(
+                "Search failed",
+                collection=self.collection_name,
+                error=str(e),
+            )
+            raise
+    
+    async def _search_locked(
+        self,
+        query_vector: np.ndarray,
+        top_k: int,
+        filters: dict[str, Any] | None,
+        include_vector: bool,
+    ) -> list[SearchResult]:
+        """Search body; the caller holds self._lock."""
+        live = int(self._live.sum())
+        if self._index is None:
+            # Too few rows to train on yet: score every live row
+            candidates = np.flatnonzero(self._live)
+        else:
+            # Over-fetch to cover reranking, tombstoned rows and filters
+            k = min(top_k * self.refine_ratio * (4 if filters else 1), len(self._ids))
+            candidates = await asyncio.to_thread(self._search_index, query_vector, k)
+            candidates = candidates[(candidates >= 0) & self._live[np.maximum(candidates, 0)]]
+        
+        if filters:
+            candidates = np.array(
+                [row for row in candidates.tolist() if _matches(self._payloads[row], filters)],
+                dtype=np.int64,
+            )
+        
+        # Exact scores from full-precision host vectors
+        candidate_vectors = self._vectors[candidates]
+        if self.distance_metric == DistanceMetric.EUCLIDEAN:
+            distances = np.linalg.norm(candidate_vectors - query_vector[0], axis=1)
+            scores = -distances
+        else:
+            scores = candidate_vectors @ query_vector[0]
+            distances = 1.0 - scores if self.distance_metric == DistanceMetric.COSINE else -scores
+        
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        
+        search_results = []
+        for i in order.tolist():
+            row = int(candidates[i])
+            metadata = VectorMetadata.from_storage(self._payloads[row])
+            search_results.append(SearchResult.model_construct(
+                id=self._ids[row],
+                score=float(scores[i]),
+                text=metadata.text,
+                metadata=metadata,
+                vector=self._vectors[row].tolist() if include_vector else None,
+                distance=float(distances[i]),
+            ))
+        
+        logger.info(
+            "Search completed",
+            collection=self.collection_name,
+            results_found=len(search_results),
+            live_vectors=live,
+        )
+        
+        return search_results
+    
+    async def delete(
+        self,
+        ids: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> int:
+        """Tombstone vectors by ID or filter."""
+        async with self._lock:
+            if ids:
+                rows = [self._rows.pop(idx) for idx in ids if idx in self._rows]
+            elif filters:
+                matched = [
+                    idx for idx, row in self._rows.items()
+                    if _matches(self._payloads[row], filters)
+                ]
+                rows = [self._rows.pop(idx) for idx in matched]
+            else:
+                raise ValueError("Must provide either ids or filters")
+            
+            self._live[rows] = False
+        
+        logger.info(
+            "Vectors deleted",
+            collection=self.collection_name,
+            count=len(rows),
+        )
+        
+        return len(rows)
+    
+    async def get(
+        self,
+        ids: list[str],
+        include_vector: bool = False,
+    ) -> list[SearchResult]:
+        """Retrieve vectors by ID from host storage."""
+        search_results = []
+        for idx in ids:
+            row = self._rows.get(idx)
+            if row is None:
+                continue
+            metadata = VectorMetadata.from_storage(self._payloads[row])
+            search_results.append(SearchResult.model_construct(
+                id=idx,
+                score=1.0,
+                text=metadata.text,
+                metadata=metadata,
+                vector=self._vectors[row].tolist() if include_vector else None,
+            ))
+        
+        return search_results
+    
+    async def count(self, filters: dict[str, Any] | None = None) -> int:
+        """Count live vectors."""
+        if not filters:
+            return len(self._rows)
+        return sum(
+            1 for row in self._rows.values()
+            if _matches(self._payloads[row], filters)
+        )
+    
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        """L2-normalize rows for cosine (searched as inner product)."""
+        if self.distance_metric != DistanceMetric.COSINE:
+            return vectors
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+    
+    def _build_index(self, vectors: np.ndarray):
+        """Train a new index on all rows (blocking)."""
+        params = ivf_pq.IndexParams(
+            n_lists=min(self.n_lists, len(vectors)),
+            metric=METRIC_MAP[self.distance_metric],
+            pq_dim=self.pq_dim,
+            pq_bits=self.pq_bits,
+        )
+        # build() assigns row positions 0..N-1, which match the host arrays
+        return ivf_pq.build(params, cupy.asarray(vectors))
+    
+    def _extend_index(self, vectors: np.ndarray, positions: np.ndarray):
+        """Add rows to the trained index under their host positions (blocking)."""
+        return ivf_pq.extend(self._index, cupy.asarray(vectors), cupy.asarray(positions))
+    
+    def _search_index(self, queries: np.ndarray, k: int) -> np.ndarray:
+        """Approximate k-NN row positions for one query (blocking)."""
+        _, neighbors = ivf_pq.search(
+            ivf_pq.SearchParams(n_probes=self.n_probes),
+            self._index,
+            cupy.asarray(queries),
+            k,
+        )
+        return cupy.asnumpy(neighbors)[0].astype(np.int64)
+
+
+def _matches(payload: dict[str, Any], filters: dict[str, Any]) -> bool:
+    """Equality filter on a stored payload; list values match any element."""
+    for key, value in filters.items():
+        stored = payload.get(key)
+        if isinstance(value, list):
+            if isinstance(stored, list):
+                if not any(item in stored for item in value):
+                    return False
+            elif stored not in value:
+                return False
+        elif stored != value:
+            return False
+    return True
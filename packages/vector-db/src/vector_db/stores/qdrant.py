@@ -10,8 +10,11 @@ Features:
 - High performance (Rust-based)
 """
 
+import asyncio
 import structlog
-from typing import Any
+from functools import lru_cache
+from typing import Any, Hashable
+from urllib.parse import urlparse
 import numpy as np
 
 from qdrant_client import AsyncQdrantClient
@@ -20,17 +23,25 @@ from qdrant_client.models import (
     VectorParams,
     PointStruct,
     Filter,
-    FieldCondition, 
+    FieldCondition,
     MatchValue,
+    MatchAny,
     SearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    QuantizationSearchParams,
 )
 
 from vector_db.base import (
-    VectorStore,
+    BaseVectorStore,
     VectorDBProvider,
     SearchResult,
     VectorMetadata,
     DistanceMetric,
+    QuantizationMode,
 )
 
 logger = structlog.get_logger(__name__)
@@ -44,8 +55,30 @@ DISTANCE_MAP = {
     DistanceMetric.MANHATTAN: Distance.MANHATTAN,
 }
 
+# Map our quantization modes to Qdrant's native (server-side) quantizers;
+# quantized vectors are held in RAM, originals on disk for rescoring
+QUANTIZATION_MAP = {
+    QuantizationMode.NONE: None,
+    QuantizationMode.INT8: ScalarQuantization(
+        scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True),
+    ),
+    QuantizationMode.BINARY: BinaryQuantization(
+        binary=BinaryQuantizationConfig(always_ram=True),
+    ),
+}
+
+# Quantized search fetches extra candidates and rescores them with the
+# original vectors to recover recall
+QUANTIZED_SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0),
+)
 
-class QdrantStore(VectorStore):
+# IDs per retrieve/delete request; larger ID lists are split and sent
+# concurrently to stay under request size limits
+ID_BATCH_SIZE = 512
+
+
+class QdrantStore(BaseVectorStore):
     """
     Qdrant vector database client.
     
@@ -63,12 +96,28 @@ class QdrantStore(VectorStore):
         distance_metric: DistanceMetric = DistanceMetric.COSINE,
         url: str = "http://localhost:6333",
         api_key: str | None = None,
+        quantization: QuantizationMode = QuantizationMode.NONE,
+        batch_size: int = 256,
+        max_concurrency: int = 4,
+        prefer_grpc: bool = True,
+        grpc_port: int = 6334,
         **kwargs,
     ):
-        super().__init__(collection_name, dimension, distance_metric, **kwargs)
+        super().__init__(collection_name, dimension, distance_metric, quantization, **kwargs)
+        
+        # Upserts are sent in batch_size chunks, max_concurrency in flight
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
         
+        # gRPC sends vectors as packed floats over one multiplexed HTTP/2
+        # connection; REST (url's port) remains the fallback transport
+        parsed = urlparse(url)
         self.client = AsyncQdrantClient(
-            url=url,
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6333,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
+            https=parsed.scheme == "https",
             api_key=api_key,
             **kwargs,
         )
@@ -78,12 +127,17 @@ class QdrantStore(VectorStore):
             collection=collection_name,
             dimension=dimension,
             url=url,
+            grpc=prefer_grpc,
         )
     
     @property
     def provider(self) -> VectorDBProvider:
         return VectorDBProvider.QDRANT
     
+    async def close(self) -> None:
+        """Close the Qdrant client."""
+        await self.client.close()
+    
     async def create_collection(self) -> bool:
         """Create Qdrant collection with vector configuration."""
         try:
@@ -98,6 +152,7 @@ class QdrantStore(VectorStore):
                     size=self.dimension,
                     distance=DISTANCE_MAP[self.distance_metric],
                 ),
+                quantization_config=QUANTIZATION_MAP[self.quantization],
             )
             
             logger.info("Collection created", collection=self.collection_name)
@@ -143,43 +198,53 @@ class QdrantStore(VectorStore):
         ids: list[str],
     ) -> int:
         """Insert or update vectors in Qdrant."""
-        if len(vectors) != len(metadata) != len(ids):
-            raise ValueError("vectors, metadata, and ids must have the same length")
+        n = self._check_batch_lengths(vectors, metadata, ids)
         
-        # Convert numpy to list if needed
-        if isinstance(vectors, np.ndarray):
-            vectors = vectors.tolist()
+        # Validate shape once; rows stay float32 until their batch is sent
+        vectors = self._as_f32_matrix(vectors)
         
         logger.debug(
             "Upserting vectors",
             collection=self.collection_name,
-            count=len(vectors),
+            count=n,
         )
         
         try:
-            # Build points
-            points = [
-                PointStruct(
-                    id=idx,
-                    vector=vector,
-                    payload=meta.to_dict(),
-                )
-                for idx, vector, meta in zip(ids, vectors, metadata)
-            ]
+            payloads = VectorMetadata.batch_to_dicts(metadata)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
             
-            # Batch upsert
-            await self.client.upsert(
-                collection_name=self.collection_name,
-                points=points,
-            )
+            async def upsert_batch(start: int) -> None:
+                end = start + self.batch_size
+                async with semaphore:
+                    # Points are built per batch, so only in-flight batches are held
+                    # PointStruct validates vectors as float lists, so only
+                    # this batch's rows are converted
+                    points = [
+                        PointStruct(
+                            id=idx,
+                            vector=vector,
+                            payload=payload,
+                        )
+                        for idx, vector, payload in zip(
+                            ids[start:end], vectors[start:end].tolist(), payloads[start:end]
+                        )
+                    ]
+                    await self.client.upsert(
+                        collection_name=self.collection_name,
+                        points=points,
+                    )
+            
+            await asyncio.gather(*(
+                upsert_batch(start) for start in range(0, n, self.batch_size)
+            ))
             
             logger.info(
                 "Vectors upserted",
                 collection=self.collection_name,
-                count=len(points),
+                count=n,
             )
             
-            return len(points)
+            return n
             
         except Exception as e:
             logger.error(
@@ -197,8 +262,8 @@ class QdrantStore(VectorStore):
         include_vector: bool = False,
     ) -> list[SearchResult]:
         """Search for similar vectors in Qdrant."""
-        if isinstance(query_vector, np.ndarray):
-            query_vector = query_vector.tolist()
+        # The client accepts numpy query vectors as-is
+        query_vector = self._as_f32_vector(query_vector)
         
         logger.debug(
             "Searching vectors",
@@ -219,6 +284,11 @@ class QdrantStore(VectorStore):
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=qdrant_filter,
+                search_params=(
+                    QUANTIZED_SEARCH_PARAMS
+                    if self.quantization is not QuantizationMode.NONE
+                    else None
+                ),
                 with_payload=True,
                 with_vectors=include_vector,
             )
@@ -226,9 +296,9 @@ class QdrantStore(VectorStore):
             # Convert to SearchResult
             search_results = []
             for result in results:
-                metadata = VectorMetadata.from_dict(result.payload)
+                metadata = VectorMetadata.from_storage(result.payload)
                 
-                search_results.append(SearchResult(
+                search_results.append(SearchResult.model_construct(
                     id=str(result.id),
                     score=result.score,
                     text=metadata.text,
@@ -269,9 +339,12 @@ class QdrantStore(VectorStore):
         try:
             if ids:
                 # Delete by IDs
-                await self.client.delete(
-                    collection_name=self.collection_name,
-                    points_selector=ids,
+                await self._gather_id_batches(
+                    ids,
+                    lambda batch: self.client.delete(
+                        collection_name=self.collection_name,
+                        points_selector=batch,
+                    ),
                 )
                 count = len(ids)
             elif filters:
@@ -314,18 +387,21 @@ class QdrantStore(VectorStore):
         )
         
         try:
-            results = await self.client.retrieve(
-                collection_name=self.collection_name,
-                ids=ids,
-                with_payload=True,
-                with_vectors=include_vector,
+            batches = await self._gather_id_batches(
+                ids,
+                lambda batch: self.client.retrieve(
+                    collection_name=self.collection_name,
+                    ids=batch,
+                    with_payload=True,
+                    with_vectors=include_vector,
+                ),
             )
             
             search_results = []
-            for result in results:
-                metadata = VectorMetadata.from_dict(result.payload)
+            for result in (point for batch in batches for point in batch):
+                metadata = VectorMetadata.from_storage(result.payload)
                 
-                search_results.append(SearchResult(
+                search_results.append(SearchResult.model_construct(
                     id=str(result.id),
                     score=1.0,  # No score for direct retrieval
                     text=metadata.text,
@@ -350,6 +426,26 @@ class QdrantStore(VectorStore):
             )
             raise
     
+    async def _gather_id_batches(self, ids: list[str], request) -> list[Any]:
+        """
+        Run request(batch) over ID_BATCH_SIZE slices of ids.
+        
+        A single slice is sent directly; otherwise slices run concurrently
+        (at most max_concurrency in flight) and results keep slice order.
+        """
+        if len(ids) <= ID_BATCH_SIZE:
+            return [await request(ids)]
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(start: int) -> Any:
+            async with semaphore:
+                return await request(ids[start:start + ID_BATCH_SIZE])
+        
+        return await asyncio.gather(*(
+            run(start) for start in range(0, len(ids), ID_BATCH_SIZE)
+        ))
+    
     async def count(self, filters: dict[str, Any] | None = None) -> int:
         """Count vectors in Qdrant collection."""
         try:
@@ -366,32 +462,51 @@ class QdrantStore(VectorStore):
             )
             return 0
     
-    def _build_filter(self, filters: dict[str, Any]) -> Filter:
+    def _build_filter(self, filters: dict[str, Any]) -> Filter | None:
         """
         Build Qdrant filter from simple dict.
         
         Supports:
         - Exact match: {"category": "docs"}
         - List match: {"tags": ["python", "code"]}
-        """
-        conditions = []
         
-        for key, value in filters.items():
-            if isinstance(value, list):
-                # Match any value in list
-                conditions.append(
-                    FieldCondition(
-                        key=key,
-                        match=MatchValue(any=value),
-                    )
+        Filters recur across queries, so built objects are memoized on a
+        hashable form of the dict.
+        """
+        try:
+            key = tuple(sorted(
+                (k, tuple(v) if isinstance(v, list) else v)
+                for k, v in filters.items()
+            ))
+            return _build_filter_cached(key)
+        except TypeError:
+            # Unhashable or unorderable values: build without caching
+            return _build_filter_cached.__wrapped__(
+                tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in filters.items())
+            )
+
+
+@lru_cache(maxsize=1024)
+def _build_filter_cached(items: tuple[tuple[str, Hashable], ...]) -> Filter | None:
+    """Build a Qdrant filter from (key, value) pairs; tuples match any value."""
+    conditions = []
+    
+    for key, value in items:
+        if isinstance(value, tuple):
+            # Match any value in list
+            conditions.append(
+                FieldCondition(
+                    key=key,
+                    match=MatchAny(any=list(value)),
                 )
-            else:
-                # Exact match
-                conditions.append(
-                    FieldCondition(
-                        key=key,
-                        match=MatchValue(value=value),
-                    )
+            )
+        else:
+            # Exact match
+            conditions.append(
+                FieldCondition(
+                    key=key,
+                    match=MatchValue(value=value),
                 )
-        
-        return Filter(must=conditions) if conditions else None
+            )
+    
+    return Filter(must=conditions) if conditions else None
@@ -10,25 +10,138 @@ Features:
 - Schema management
 """
 
+import asyncio
+import hashlib
+import json
+import threading
+import uuid
 import structlog
+from collections.abc import Hashable
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urlparse
 import numpy as np
 
 import weaviate
-from weaviate.classes.query import MetadataQuery
+from cachetools import TTLCache
+from weaviate.classes.init import AdditionalConfig, Timeout
+from weaviate.classes.query import Filter, MetadataQuery
+from weaviate.classes.tenants import Tenant
 
 from vector_db.base import (
-    VectorStore,
+    BaseVectorStore,
     VectorDBProvider,
     SearchResult,
     VectorMetadata,
     DistanceMetric,
+    QuantizationMode,
 )
+from vector_db.exceptions import VectorDBError
 
 logger = structlog.get_logger(__name__)
 
+# Process-wide clients keyed by server address and API key: stores for the
+# same server share one HTTP/gRPC connection pool instead of connecting per
+# instance
+_CLIENT_CACHE: dict[tuple, weaviate.WeaviateClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
 
-class WeaviateStore(VectorStore):
+# Connect once quickly; allow long-running batch inserts
+CLIENT_TIMEOUT = Timeout(init=10, query=30, insert=120)
+
+# Map our distance metrics to Weaviate's
+DISTANCE_MAP = {
+    DistanceMetric.COSINE: weaviate.classes.config.VectorDistances.COSINE,
+    DistanceMetric.EUCLIDEAN: weaviate.classes.config.VectorDistances.L2_SQUARED,
+    DistanceMetric.DOT_PRODUCT: weaviate.classes.config.VectorDistances.DOT,
+    DistanceMetric.MANHATTAN: weaviate.classes.config.VectorDistances.MANHATTAN,
+}
+
+# Map our quantization modes to Weaviate's server-side vector compression;
+# the uncompressed vectors are kept for rescoring
+QUANTIZER_MAP = {
+    QuantizationMode.NONE: None,
+    QuantizationMode.INT8: weaviate.classes.config.Configure.VectorIndex.Quantizer.sq(),
+    QuantizationMode.BINARY: weaviate.classes.config.Configure.VectorIndex.Quantizer.bq(),
+}
+
+# Filter key suffixes ("field__op") and the Weaviate property filter
+# methods they compile to; a bare field name means equality
+FILTER_OPERATORS = {
+    "": "equal",
+    "ne": "not_equal",
+    "gt": "greater_than",
+    "gte": "greater_or_equal",
+    "lt": "less_than",
+    "lte": "less_or_equal",
+    "in": "contains_any",
+    "all": "contains_all",
+    "like": "like",
+}
+
+# Query metadata requests, built once: only what results are made from
+SEARCH_METADATA = MetadataQuery(distance=True)
+HYBRID_METADATA = MetadataQuery(score=True)
+
+# IDs per by-ID filter request (stays under the server's result and
+# request-size limits)
+ID_BATCH_SIZE = 1000
+
+# Concurrent single-object fetches when the by-ID filter is unsupported
+FETCH_BY_ID_CONCURRENCY = 16
+
+
+def _get_client(
+    url: str,
+    api_key: str | None,
+    grpc_host: str | None,
+    grpc_port: int,
+    grpc_secure: bool | None,
+) -> weaviate.WeaviateClient:
+    """Return the shared client for a server, connecting on first use."""
+    key = (url, api_key, grpc_host, grpc_port, grpc_secure)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE[key] = _connect(*key)
+    return client
+
+
+def _connect(
+    url: str,
+    api_key: str | None,
+    grpc_host: str | None,
+    grpc_port: int,
+    grpc_secure: bool | None,
+) -> weaviate.WeaviateClient:
+    """
+    Open a Weaviate client connection.
+    
+    Queries and batch inserts go over gRPC (packed protobuf vectors); the
+    REST endpoint from url serves schema operations.
+    """
+    parsed = urlparse(url)
+    secure = parsed.scheme == "https"
+    client = weaviate.connect_to_custom(
+        http_host=parsed.hostname or "localhost",
+        http_port=parsed.port or (443 if secure else 8080),
+        http_secure=secure,
+        grpc_host=grpc_host or parsed.hostname or "localhost",
+        grpc_port=grpc_port,
+        grpc_secure=secure if grpc_secure is None else grpc_secure,
+        auth_credentials=weaviate.auth.AuthApiKey(api_key) if api_key else None,
+        additional_config=AdditionalConfig(timeout=CLIENT_TIMEOUT),
+    )
+    logger.info(
+        "Weaviate connected",
+        url=url,
+        grpc_port=grpc_port,
+        version=client.get_meta().get("version"),
+    )
+    return client
+
+
+class WeaviateStore(BaseVectorStore):
     """
     Weaviate vector database client.
     
@@ -45,20 +158,92 @@ class WeaviateStore(VectorStore):
         distance_metric: DistanceMetric = DistanceMetric.COSINE,
         url: str = "http://localhost:8080",
         api_key: str | None = None,
+        grpc_host: str | None = None,
+        grpc_port: int = 50051,
+        grpc_secure: bool | None = None,
+        quantization: QuantizationMode = QuantizationMode.NONE,
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 200,
+        hnsw_ef: int = -1,
+        dynamic_ef_min: int = 100,
+        dynamic_ef_max: int = 500,
+        dynamic_ef_factor: int = 8,
+        batch_size: int = 200,
+        concurrent_requests: int = 2,
+        query_cache_size: int = 1024,
+        query_cache_ttl: float = 60.0,
+        enable_async_insert: bool = False,
+        async_insert_wait_ms: float = 50,
+        async_insert_max_rows: int = 1000,
+        multi_tenant: bool = False,
         **kwargs,
     ):
-        super().__init__(collection_name, dimension, distance_metric, **kwargs)
+        """
+        Args:
+            url: REST endpoint, e.g. "http://localhost:8080"
+            grpc_host: gRPC host (default: the host of url)
+            grpc_port: gRPC port
+            grpc_secure: Use TLS for gRPC (default: whether url is https)
+            hnsw_m: Max graph connections per node
+            hnsw_ef_construction: Candidate list size while building the graph
+            hnsw_ef: Candidate list size per query; -1 derives it from the
+                query limit (top_k * dynamic_ef_factor, clamped to
+                [dynamic_ef_min, dynamic_ef_max])
+            batch_size: Objects per batch request on upsert
+            concurrent_requests: Batch requests in flight on upsert
+            query_cache_size: Recent search results kept in memory for
+                repeated queries; 0 disables the cache
+            query_cache_ttl: Seconds a cached search result stays valid
+            enable_async_insert: Coalesce concurrent small upserts into one
+                batch; each upsert() returns once its batch is written
+            async_insert_wait_ms: How long a batch waits for more upserts
+            async_insert_max_rows: Rows that flush a batch without waiting
+            multi_tenant: Create the collection with multi-tenancy, giving each
+                tenant its own (smaller) HNSW index; data methods then take a
+                tenant, which is created on first use
+        """
+        super().__init__(collection_name, dimension, distance_metric, quantization, **kwargs)
         
-        # Initialize Weaviate client
-        if api_key:
-           self.client = weaviate.connect_to_custom(
-                http_host=url.replace("http://", "").replace("https://", ""),
-                http_port=8080,
-                http_secure=False,
-                auth_credentials=weaviate.auth.AuthApiKey(api_key),
-            )
-        else:
-            self.client = weaviate.connect_to_local(host=url.replace("http://", ""))
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef = hnsw_ef
+        self.dynamic_ef_min = dynamic_ef_min
+        self.dynamic_ef_max = dynamic_ef_max
+        self.dynamic_ef_factor = dynamic_ef_factor
+        
+        # Upserts go out in fixed-size batch requests, several in flight
+        self.batch_size = batch_size
+        self.concurrent_requests = concurrent_requests
+        
+        # The client's batcher isn't thread-safe: one batch run at a time
+        self._batch_lock = threading.Lock()
+        
+        # Search results by query (see _query_key); cleared on every write
+        self._query_cache: TTLCache | None = (
+            TTLCache(maxsize=query_cache_size, ttl=query_cache_ttl)
+            if query_cache_size > 0 else None
+        )
+        # Bumped on every clear; a search only caches its result if no write
+        # finished while it was running
+        self._write_generation = 0
+        
+        # Coalesced upserts: (ids, vectors, metadata, tenant, future) entries
+        # drained by a background task started on first use (see _insert_worker)
+        self.enable_async_insert = enable_async_insert
+        self.async_insert_wait_ms = async_insert_wait_ms
+        self.async_insert_max_rows = async_insert_max_rows
+        self._insert_queue: asyncio.Queue = asyncio.Queue()
+        self._insert_task: asyncio.Task | None = None
+        
+        # Collection handle, resolved on first use (see _get_collection)
+        self._collection = None
+        
+        # Tenants known to exist, so each is provisioned at most once
+        self.multi_tenant = multi_tenant
+        self._known_tenants: set[str] = set()
+        
+        # Shared per server; see shutdown()
+        self.client = _get_client(url, api_key, grpc_host, grpc_port, grpc_secure)
         
         logger.info(
             "Weaviate client initialized",
@@ -70,6 +255,63 @@ class WeaviateStore(VectorStore):
     def provider(self) -> VectorDBProvider:
         return VectorDBProvider.WEAVIATE
     
+    async def close(self) -> None:
+        """
+        Release this store, writing any queued upserts first.
+        
+        The client is shared with other stores for the same server and
+        stays open; call WeaviateStore.shutdown() on application exit.
+        """
+        task, self._insert_task = self._insert_task, None
+        if task is None:
+            return
+        if task.done():
+            # The worker died: nothing will write what is still queued
+            self._fail_pending([], RuntimeError("Weaviate insert queue stopped"))
+        else:
+            # The worker fails what it can't write when it stops, so this
+            # can't hang on a dying worker
+            await self._insert_queue.join()
+            task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    
+    async def __aenter__(self) -> "WeaviateStore":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close all shared Weaviate clients."""
+        with _CLIENT_CACHE_LOCK:
+            clients = list(_CLIENT_CACHE.values())
+            _CLIENT_CACHE.clear()
+        for client in clients:
+            client.close()
+    
+    def _get_collection(self):
+        """Return the collection handle, looking it up once."""
+        if self._collection is None:
+            self._collection = self.client.collections.get(self.collection_name)
+        return self._collection
+    
+    async def _collection_for(self, tenant: str | None):
+        """Return the collection handle, scoped to a tenant if given."""
+        collection = self._get_collection()
+        if tenant is None:
+            return collection
+        if tenant not in self._known_tenants:
+            await asyncio.to_thread(self._ensure_tenant, collection, tenant)
+            self._known_tenants.add(tenant)
+        return collection.with_tenant(tenant)
+    
+    @staticmethod
+    def _ensure_tenant(collection, tenant: str) -> None:
+        """Create a tenant unless it already exists (blocking)."""
+        if not collection.tenants.exists(tenant):
+            collection.tenants.create([Tenant(name=tenant)])
+    
     async def create_collection(self) -> bool:
         """Create Weaviate collection (class)."""
         try:
@@ -79,11 +321,22 @@ class WeaviateStore(VectorStore):
                 return False
             
             # Create collection with properties
-            self.client.collections.create(
+            await asyncio.to_thread(
+                self.client.collections.create,
                 name=self.collection_name,
                 vectorizer_config=None,  # We provide vectors
+                multi_tenancy_config=weaviate.classes.config.Configure.multi_tenancy(
+                    enabled=self.multi_tenant
+                ),
                 vector_index_config=weaviate.classes.config.Configure.VectorIndex.hnsw(
-                    distance_metric=weaviate.classes.config.VectorDistances.COSINE
+                    distance_metric=DISTANCE_MAP[self.distance_metric],
+                    max_connections=self.hnsw_m,
+                    ef_construction=self.hnsw_ef_construction,
+                    ef=self.hnsw_ef,
+                    dynamic_ef_min=self.dynamic_ef_min,
+                    dynamic_ef_max=self.dynamic_ef_max,
+                    dynamic_ef_factor=self.dynamic_ef_factor,
+                    quantizer=QUANTIZER_MAP[self.quantization],
                 ),
                 properties=[
                     weaviate.classes.config.Property(
@@ -112,10 +365,36 @@ class WeaviateStore(VectorStore):
             )
             raise
     
+    async def set_ef(self, ef: int) -> None:
+        """
+        Change the query-time candidate list size of an existing collection.
+        
+        Weaviate has no per-query ef, so this reconfigures the collection;
+        use it to trade recall for latency under a changing time budget.
+        -1 restores dynamic ef.
+        """
+        try:
+            await asyncio.to_thread(
+                self._get_collection().config.update,
+                vector_index_config=weaviate.classes.config.Reconfigure.VectorIndex.hnsw(ef=ef),
+            )
+            self.hnsw_ef = ef
+            logger.info("Search ef updated", collection=self.collection_name, ef=ef)
+        except Exception as e:
+            logger.error(
+                "Failed to update search ef",
+                collection=self.collection_name,
+                error=str(e),
+            )
+            raise
+    
     async def delete_collection(self) -> bool:
         """Delete Weaviate collection."""
         try:
-            self.client.collections.delete(self.collection_name)
+            await asyncio.to_thread(self.client.collections.delete, self.collection_name)
+            self._collection = None
+            self._known_tenants.clear()
+            self._clear_query_cache()
             logger.info("Collection deleted", collection=self.collection_name)
             return True
         except Exception as e:
@@ -129,7 +408,7 @@ class WeaviateStore(VectorStore):
     async def collection_exists(self) -> bool:
         """Check if collection exists."""
         try:
-            return self.client.collections.exists(self.collection_name)
+            return await asyncio.to_thread(self.client.collections.exists, self.collection_name)
         except Exception:
             return False
     
@@ -138,38 +417,134 @@ class WeaviateStore(VectorStore):
         vectors: list[list[float]] | np.ndarray,
         metadata: list[VectorMetadata],
         ids: list[str],
+        tenant: str | None = None,
     ) -> int:
         """Insert or update vectors in Weaviate."""
-        if len(vectors) != len(metadata) != len(ids):
-            raise ValueError("vectors, metadata, and ids must have the same length")
+        self._check_batch_lengths(vectors, metadata, ids)
         
-        if isinstance(vectors, np.ndarray):
-            vectors = vectors.tolist()
+        # Validate shape once; the client serializes each float32 row as it
+        # is batched, so no N x D Python list is ever built
+        vectors = self._as_f32_matrix(vectors)
+        
+        if self.enable_async_insert:
+            return await self._enqueue_upsert(ids, vectors, metadata, tenant)
+        return await self._write_objects(ids, vectors, metadata, tenant)
+    
+    async def _enqueue_upsert(
+        self,
+        ids: list[str],
+        vectors: np.ndarray,
+        metadata: list[VectorMetadata],
+        tenant: str | None,
+    ) -> int:
+        """Queue an upsert for the next coalesced batch and wait for it."""
+        future = asyncio.get_running_loop().create_future()
+        await self._insert_queue.put((ids, vectors, metadata, tenant, future))
+        if self._insert_task is None or self._insert_task.done():
+            self._insert_task = asyncio.create_task(self._insert_worker())
+        return await future
+    
+    async def _insert_worker(self) -> None:
+        """Drain queued upserts into batches of up to async_insert_max_rows."""
+        loop = asyncio.get_running_loop()
+        pending: list = []
+        try:
+            while True:
+                pending = [await self._insert_queue.get()]
+                rows = len(pending[0][0])
+                deadline = loop.time() + self.async_insert_wait_ms / 1000
+                while rows < self.async_insert_max_rows:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._insert_queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                    pending.append(item)
+                    rows += len(item[0])
+                
+                # Objects are written per tenant, so one batch per tenant queued
+                by_tenant: dict[str | None, list] = {}
+                for item in pending:
+                    by_tenant.setdefault(item[3], []).append(item)
+                
+                for tenant, items in by_tenant.items():
+                    try:
+                        await self._write_objects(
+                            [idx for item in items for idx in item[0]],
+                            np.concatenate([item[1] for item in items]),
+                            [meta for item in items for meta in item[2]],
+                            tenant,
+                        )
+                    except Exception as e:
+                        # One failed batch fails every upsert coalesced into it
+                        for *_, future in items:
+                            if not future.done():
+                                future.set_exception(e)
+                    else:
+                        for ids, *_, future in items:
+                            if not future.done():
+                                future.set_result(len(ids))
+                
+                for _ in pending:
+                    self._insert_queue.task_done()
+                pending = []
+        finally:
+            # Cancelled or crashed: fail the batch in hand and everything
+            # still queued, so no upsert() waits forever
+            self._fail_pending(pending, RuntimeError("Weaviate insert queue stopped"))
+    
+    def _fail_pending(self, pending: list, error: Exception) -> None:
+        """Fail taken-but-unfinished entries and drain the queue (marking all done)."""
+        while not self._insert_queue.empty():
+            pending.append(self._insert_queue.get_nowait())
+        for *_, future in pending:
+            if not future.done():
+                future.set_exception(error)
+        for _ in pending:
+            self._insert_queue.task_done()
+    
+    async def _write_objects(
+        self,
+        ids: list[str],
+        vectors: np.ndarray,
+        metadata: list[VectorMetadata],
+        tenant: str | None,
+    ) -> int:
+        """Write one batch of validated objects."""
+        n = len(ids)
         
         logger.debug(
             "Upserting vectors",
             collection=self.collection_name,
-            count=len(vectors),
+            count=n,
         )
         
         try:
-            collection = self.client.collections.get(self.collection_name)
+            collection = await self._collection_for(tenant)
             
-            with collection.batch.dynamic() as batch:
-                for idx, vector, meta in zip(ids, vectors, metadata):
-                    batch.add_object(
-                        properties=meta.to_dict(),
-                        vector=vector,
-                        uuid=idx,
-                    )
+            # The whole batch run blocks; keep it off the event loop
+            failed = await asyncio.to_thread(
+                self._write_batch, collection, ids, vectors, metadata
+            )
+            if failed:
+                raise VectorDBError(
+                    f"{len(failed)} of {n} objects failed to upsert: "
+                    f"{failed[0].message}",
+                    provider=self.provider.value,
+                    collection=self.collection_name,
+                )
+            
+            self._clear_query_cache()
             
             logger.info(
                 "Vectors upserted",
                 collection=self.collection_name,
-                count=len(vectors),
+                count=n,
             )
             
-            return len(vectors)
+            return n
             
         except Exception as e:
             logger.error(
@@ -185,10 +560,19 @@ class WeaviateStore(VectorStore):
         top_k: int = 10,
         filters: dict[str, Any] | None = None,
         include_vector: bool = False,
+        return_properties: list[str] | None = None,
+        tenant: str | None = None,
     ) -> list[SearchResult]:
-        """Search for similar vectors in Weaviate."""
-        if isinstance(query_vector, np.ndarray):
-            query_vector = query_vector.tolist()
+        """
+        Search for similar vectors in Weaviate.
+        
+        Args:
+            return_properties: Properties to fetch per hit (default: all);
+                metadata fields not fetched are left at their defaults
+            tenant: Tenant to search (multi-tenant collections)
+        """
+        # The client accepts numpy vectors as-is
+        query_vector = self._as_f32_vector(query_vector)
         
         logger.debug(
             "Searching vectors",
@@ -196,38 +580,66 @@ class WeaviateStore(VectorStore):
             top_k=top_k,
         )
         
+        generation = self._write_generation
+        if self._query_cache is not None:
+            key = self._query_key(
+                query_vector, top_k, filters, include_vector, return_properties, tenant
+            )
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                return list(cached)
+        
         try:
-            collection = self.client.collections.get(self.collection_name)
+            collection = await self._collection_for(tenant)
             
-            # Execute vector search
-            response = collection.query.near_vector(
+            # Execute vector search, filtering on the server
+            response = await asyncio.to_thread(
+                collection.query.near_vector,
                 near_vector=query_vector,
                 limit=top_k,
-                return_metadata=MetadataQuery(distance=True),
+                filters=self._build_filter(filters) if filters else None,
+                return_metadata=SEARCH_METADATA,
+                return_properties=return_properties,
                 include_vector=include_vector,
             )
             
-            # Convert to SearchResult
+            # Convert distances to scores in one array op; only cosine distance
+            # is bounded, so other metrics score as negated distance (higher is
+            # still better)
+            objects = response.objects
+            distances = np.fromiter(
+                (obj.metadata.distance for obj in objects),
+                dtype=np.float64,
+                count=len(objects),
+            )
+            if self.distance_metric == DistanceMetric.COSINE:
+                scores = 1.0 - distances
+            else:
+                scores = -distances
+            
             search_results = []
-            for obj in response.objects:
+            for obj, score, distance in zip(objects, scores.tolist(), distances.tolist()):
                 metadata = VectorMetadata.from_dict(obj.properties)
                 
                 search_results.append(SearchResult(
                     id=str(obj.uuid),
-                    score=1.0 - obj.metadata.distance,  # Convert distance to score
+                    score=score,
                     text=metadata.text,
                     metadata=metadata,
                     vector=obj.vector.get("default") if include_vector and obj.vector else None,
-                    distance=obj.metadata.distance,
+                    distance=distance,
                 ))
             
+            if self._query_cache is not None and generation == self._write_generation:
+                self._query_cache[key] = search_results
+            
             logger.info(
                 "Search completed",
                 collection=self.collection_name,
                 results_found=len(search_results),
             )
             
-            return search_results
+            return list(search_results)
             
         except Exception as e:
             logger.error(
@@ -237,29 +649,118 @@ class WeaviateStore(VectorStore):
             )
             raise
     
+    async def hybrid_search(
+        self,
+        query_text: str,
+        query_vector: list[float] | np.ndarray | None = None,
+        top_k: int = 10,
+        alpha: float = 0.5,
+        filters: dict[str, Any] | None = None,
+        include_vector: bool = False,
+        tenant: str | None = None,
+    ) -> list[SearchResult]:
+        """
+        Keyword (BM25) and vector search fused on the server in one query.
+        
+        Args:
+            query_text: Keyword query, matched against text properties
+            query_vector: Embedding of the query; required unless alpha is 0,
+                since collections are created without a vectorizer
+            alpha: Weight of the vector search; 0 is pure BM25, 1 pure vector
+            tenant: Tenant to search (multi-tenant collections)
+        
+        Scores are Weaviate's fused relevance scores (higher is better).
+        """
+        if query_vector is not None:
+            query_vector = self._as_f32_vector(query_vector)
+        
+        logger.debug(
+            "Hybrid searching",
+            collection=self.collection_name,
+            top_k=top_k,
+            alpha=alpha,
+        )
+        
+        try:
+            collection = await self._collection_for(tenant)
+            
+            response = await asyncio.to_thread(
+                collection.query.hybrid,
+                query=query_text,
+                vector=query_vector,
+                alpha=alpha,
+                limit=top_k,
+                filters=self._build_filter(filters) if filters else None,
+                return_metadata=HYBRID_METADATA,
+                include_vector=include_vector,
+            )
+            
+            search_results = []
+            for obj in response.objects:
+                metadata = VectorMetadata.from_dict(obj.properties)
+                search_results.append(SearchResult(
+                    id=str(obj.uuid),
+                    score=obj.metadata.score,
+                    text=metadata.text,
+                    metadata=metadata,
+                    vector=obj.vector.get("default") if include_vector and obj.vector else None,
+                ))
+            
+            logger.info(
+                "Hybrid search completed",
+                collection=self.collection_name,
+                results_found=len(search_results),
+            )
+            
+            return search_results
+            
+        except Exception as e:
+            logger.error(
+                "Hybrid search failed",
+                collection=self.collection_name,
+                error=str(e),
+            )
+            raise
+    
     async def delete(
         self,
         ids: list[str] | None = None,
         filters: dict[str, Any] | None = None,
+        tenant: str | None = None,
     ) -> int:
         """Delete vectors from Weaviate."""
         try:
-            collection = self.client.collections.get(self.collection_name)
+            collection = await self._collection_for(tenant)
             
             if ids:
-                # Delete by IDs
-                for id in ids:
-                    collection.data.delete_by_id(id)
-                count = len(ids)
+                # Delete by IDs, one request per ID_BATCH_SIZE IDs
+                count = 0
+                for start in range(0, len(ids), ID_BATCH_SIZE):
+                    batch = ids[start:start + ID_BATCH_SIZE]
+                    try:
+                        result = await asyncio.to_thread(
+                            collection.data.delete_many,
+                            where=Filter.by_id().contains_any(batch),
+                        )
+                        count += result.successful
+                    except Exception as e:
+                        # Older servers without by-ID filters
+                        logger.debug("Batched delete unavailable", error=str(e))
+                        for idx in batch:
+                            if await asyncio.to_thread(collection.data.delete_by_id, idx):
+                                count += 1
             elif filters:
                 # Delete by filter
-                result = collection.data.delete_many(
-                    where=self._build_filter(filters)
+                result = await asyncio.to_thread(
+                    collection.data.delete_many,
+                    where=self._build_filter(filters),
                 )
                 count = result.successful if hasattr(result, 'successful') else 0
             else:
                 raise ValueError("Must provide either ids or filters")
             
+            self._clear_query_cache()
+            
             logger.info(
                 "Vectors deleted",
                 collection=self.collection_name,
@@ -280,18 +781,33 @@ class WeaviateStore(VectorStore):
         self,
         ids: list[str],
         include_vector: bool = False,
+        tenant: str | None = None,
     ) -> list[SearchResult]:
         """Retrieve vectors by ID from Weaviate."""
         try:
-            collection = self.client.collections.get(self.collection_name)
+            collection = await self._collection_for(tenant)
             
+            try:
+                objects = []
+                for start in range(0, len(ids), ID_BATCH_SIZE):
+                    batch = ids[start:start + ID_BATCH_SIZE]
+                    response = await asyncio.to_thread(
+                        collection.query.fetch_objects,
+                        filters=Filter.by_id().contains_any(batch),
+                        limit=len(batch),
+                        include_vector=include_vector,
+                    )
+                    objects.extend(response.objects)
+            except Exception as e:
+                # Older servers without by-ID filters: fetch concurrently
+                logger.debug("Batched fetch unavailable", error=str(e))
+                objects = await self._fetch_each(collection, ids, include_vector)
+            
+            # One request returns matches in server order; restore request order
+            by_id = {str(obj.uuid): obj for obj in objects if obj}
             search_results = []
-            for id in ids:
-                obj = collection.query.fetch_object_by_id(
-                    id,
-                    include_vector=include_vector,
-                )
-                
+            for idx in ids:
+                obj = by_id.get(_normalize_uuid(idx))
                 if obj:
                     metadata = VectorMetadata.from_dict(obj.properties)
                     search_results.append(SearchResult(
@@ -318,10 +834,119 @@ class WeaviateStore(VectorStore):
             )
             raise
     
+    def _write_batch(
+        self,
+        collection,
+        ids: list[str],
+        vectors: np.ndarray,
+        metadata: list[VectorMetadata],
+    ) -> list:
+        """Send objects through the client's batcher; returns failed objects (blocking)."""
+        # failed_objects is shared batcher state, so it is read under the
+        # lock too; otherwise a concurrent run could replace it
+        with self._batch_lock:
+            with collection.batch.fixed_size(
+                batch_size=self.batch_size,
+                concurrent_requests=self.concurrent_requests,
+            ) as batch:
+                # Serialize metadata one batch at a time, so only batch_size
+                # property dicts are built ahead of the client
+                for start in range(0, len(ids), self.batch_size):
+                    end = start + self.batch_size
+                    properties = VectorMetadata.batch_to_dicts(metadata[start:end])
+                    for idx, vector, props in zip(ids[start:end], vectors[start:end], properties):
+                        batch.add_object(
+                            properties=props,
+                            vector=vector,
+                            uuid=idx,
+                        )
+            
+            # The batch context doesn't raise on per-object failures
+            return list(collection.batch.failed_objects)
+    
+    async def _fetch_each(self, collection, ids: list[str], include_vector: bool) -> list:
+        """Fetch objects one ID per request, concurrently in worker threads."""
+        semaphore = asyncio.Semaphore(FETCH_BY_ID_CONCURRENCY)
+        
+        async def fetch(idx: str):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    collection.query.fetch_object_by_id,
+                    idx,
+                    include_vector=include_vector,
+                )
+        
+        return await asyncio.gather(*(fetch(idx) for idx in ids))
+    
+    @staticmethod
+    def _query_key(
+        query_vector: np.ndarray,
+        top_k: int,
+        filters: dict[str, Any] | None,
+        include_vector: bool,
+        return_properties: list[str] | None,
+        tenant: str | None,
+    ) -> str:
+        """Cache key of a search: digest of the vector bytes plus its options."""
+        digest = hashlib.blake2b(query_vector.tobytes(), digest_size=16)
+        digest.update(json.dumps(
+            [top_k, include_vector, filters, return_properties, tenant],
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _clear_query_cache(self) -> None:
+        """Drop cached search results after the collection changes."""
+        self._write_generation += 1
+        if self._query_cache is not None:
+            self._query_cache.clear()
+    
     def _build_filter(self, filters: dict[str, Any]):
-        """Build Weaviate filter from dict."""
-        # Simple equality filter
-        # In production, extend this for more complex queries
-        return weaviate.classes.query.Filter.by_property(
-            list(filters.keys())[0]
-        ).equal(list(filters.values())[0])
+        """
+        Build Weaviate filter from dict; all conditions must match.
+        
+        Supports:
+        - Exact match: {"category": "docs"}
+        - List match: {"tags": ["python", "code"]} (any of the values)
+        - Operators: {"year__gte": 2020, "source__ne": "web"} (see FILTER_OPERATORS)
+        
+        Filters recur across queries, so built objects are memoized on a
+        hashable form of the dict.
+        """
+        items = tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in filters.items()
+        ))
+        try:
+            return _build_filter_cached(items)
+        except TypeError:
+            # Unhashable values: build without caching
+            return _build_filter_cached.__wrapped__(items)
+
+
+@lru_cache(maxsize=1024)
+def _build_filter_cached(items: tuple[tuple[str, Hashable], ...]):
+    """Build a Weaviate filter from (key, value) pairs; tuples match any value."""
+    conditions = []
+    for key, value in items:
+        field, _, op = key.partition("__")
+        if isinstance(value, tuple):
+            value = list(value)
+            op = op or "in"
+        method = FILTER_OPERATORS.get(op)
+        if method is None:
+            raise ValueError(f"Unsupported filter operator: {op!r} in {key!r}")
+        conditions.append(getattr(Filter.by_property(field), method)(value))
+    
+    if len(conditions) == 1:
+        return conditions[0]
+    return Filter.all_of(conditions)
+
+
+def _normalize_uuid(value: str) -> str:
+    """Canonical UUID string, as returned by Weaviate."""
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return value
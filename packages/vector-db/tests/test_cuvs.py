@@ -0,0 +1,125 @@
+"""
+Tests for CuvsStore's index lifecycle (brute force, build, extend, rebuild)
+and tombstoning, with cuVS and CuPy replaced by exact host-side fakes.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from vector_db.base import VectorMetadata
+from vector_db.stores import cuvs as cuvs_store
+from vector_db.stores.cuvs import CuvsStore
+
+DIMENSION = 4
+
+
+class FakeIvfPq:
+    """Exact stand-in for cuvs.neighbors.ivf_pq that records build/extend calls."""
+    
+    IndexParams = SimpleNamespace
+    SearchParams = SimpleNamespace
+    
+    def __init__(self):
+        self.builds: list[int] = []
+        self.extends: list[list[int]] = []
+        self.fail_build = False
+    
+    def build(self, _params, vectors):
+        if self.fail_build:
+            raise RuntimeError("out of GPU memory")
+        self.builds.append(len(vectors))
+        return SimpleNamespace(vectors=vectors, positions=np.arange(len(vectors)))
+    
+    def extend(self, index, vectors, positions):
+        self.extends.append(positions.tolist())
+        return SimpleNamespace(
+            vectors=np.concatenate([index.vectors, vectors]),
+            positions=np.concatenate([index.positions, positions]),
+        )
+    
+    def search(self, _params, index, queries, k):
+        order = np.argsort(-(index.vectors @ queries[0]), kind="stable")[:k]
+        neighbors = np.full(k, -1, dtype=np.int64)
+        neighbors[:len(order)] = index.positions[order]
+        return None, neighbors[None, :]
+
+
+@pytest.fixture
+def ivf_pq(monkeypatch) -> FakeIvfPq:
+    fake = FakeIvfPq()
+    monkeypatch.setattr(cuvs_store, "ivf_pq", fake)
+    monkeypatch.setattr(
+        cuvs_store, "cupy", SimpleNamespace(asarray=np.asarray, asnumpy=np.asarray)
+    )
+    return fake
+
+
+def axis(i: int) -> list[float]:
+    vector = [0.0] * DIMENSION
+    vector[i] = 1.0
+    return vector
+
+
+def rows(**axes: int) -> dict:
+    """Upsert arguments with one unit vector per ID (name=axis)."""
+    return {
+        "vectors": [axis(i) for i in axes.values()],
+        "metadata": [VectorMetadata(text=idx) for idx in axes],
+        "ids": list(axes),
+    }
+
+
+async def test_index_is_built_then_extended_then_rebuilt(ivf_pq):
+    store = CuvsStore("docs", DIMENSION, n_lists=2, min_train_rows=4, rebuild_growth=2.0)
+    
+    # Below min_train_rows: exact search over host rows, no index
+    await store.upsert(**rows(a=0, b=1))
+    assert ivf_pq.builds == []
+    assert [r.id for r in await store.search(axis(1), top_k=1)] == ["b"]
+    
+    await store.upsert(**rows(c=2, d=3))
+    assert ivf_pq.builds == [4]
+    
+    await store.upsert(**rows(e=0, f=1))
+    assert ivf_pq.extends == [[4, 5]]
+    
+    # 8 rows reaches 2x the 4 the index was trained on
+    await store.upsert(**rows(g=2, h=3))
+    assert ivf_pq.builds == [4, 8]
+    assert ivf_pq.extends == [[4, 5]]
+    
+    assert [r.id for r in await store.search(axis(3), top_k=2)] == ["d", "h"]
+
+
+@pytest.mark.usefixtures("ivf_pq")
+async def test_updated_and_deleted_rows_are_tombstoned():
+    store = CuvsStore("docs", DIMENSION, n_lists=2, min_train_rows=2)
+    await store.upsert(**rows(a=0, b=1))
+    
+    # Re-upserting "a" extends the index; its old row must not resurface
+    await store.upsert(vectors=[axis(2)], metadata=[VectorMetadata(text="a v2")], ids=["a"])
+    results = await store.search(axis(0), top_k=3)
+    assert sorted(r.id for r in results) == ["a", "b"]
+    assert [r.text for r in results if r.id == "a"] == ["a v2"]
+    assert await store.count() == 2
+    
+    assert await store.delete(ids=["b"]) == 1
+    assert [r.id for r in await store.search(axis(1), top_k=3)] == ["a"]
+    assert await store.count() == 1
+
+
+async def test_failed_build_leaves_store_unchanged(ivf_pq):
+    store = CuvsStore("docs", DIMENSION, n_lists=2, min_train_rows=2)
+    ivf_pq.fail_build = True
+    
+    with pytest.raises(RuntimeError, match="out of GPU memory"):
+        await store.upsert(**rows(a=0, b=1))
+    assert await store.count() == 0
+    assert await store.search(axis(0)) == []
+    
+    ivf_pq.fail_build = False
+    await store.upsert(**rows(a=0, b=1))
+    assert ivf_pq.builds == [2]
+    assert [r.id for r in await store.search(axis(0), top_k=1)] == ["a"]
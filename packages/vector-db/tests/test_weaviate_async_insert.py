@@ -0,0 +1,138 @@
+"""
+Tests for WeaviateStore's coalesced (async insert) upserts, run against a
+fake in-process client.
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from vector_db.base import VectorMetadata
+from vector_db.exceptions import VectorDBError
+from vector_db.stores import weaviate as weaviate_store
+from vector_db.stores.weaviate import WeaviateStore
+
+DIMENSION = 4
+
+
+class FakeCollection:
+    """Collection handle whose batcher records writes on the fake client."""
+    
+    def __init__(self, client: "FakeClient", tenant: str | None = None):
+        self.client = client
+        self.tenant = tenant
+        self.tenants = SimpleNamespace(exists=lambda _name: True, create=lambda _tenants: None)
+        self.batch = self
+        self.failed_objects: list = []
+    
+    def with_tenant(self, tenant: str) -> "FakeCollection":
+        return FakeCollection(self.client, tenant)
+    
+    @contextmanager
+    def fixed_size(self, **_options):
+        self.client.entered.set()
+        self.client.gate.wait()
+        ids: list[str] = []
+        yield SimpleNamespace(add_object=lambda **obj: ids.append(obj["uuid"]))
+        if self.tenant in self.client.failing_tenants:
+            self.failed_objects = [SimpleNamespace(message="write rejected")] * len(ids)
+        else:
+            self.failed_objects = []
+            self.client.writes.append((self.tenant, ids))
+
+
+class FakeClient:
+    """Stands in for weaviate.WeaviateClient; only the batch path is implemented."""
+    
+    def __init__(self):
+        self.writes: list[tuple[str | None, list[str]]] = []
+        self.failing_tenants: set[str] = set()
+        # Set when a batch run starts; clear gate to hold batch runs open
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.collections = SimpleNamespace(get=lambda _name: FakeCollection(self))
+
+
+@pytest.fixture
+def client(monkeypatch) -> FakeClient:
+    fake = FakeClient()
+    monkeypatch.setattr(weaviate_store, "_get_client", lambda *_args: fake)
+    return fake
+
+
+def make_store(**kwargs) -> WeaviateStore:
+    return WeaviateStore(
+        collection_name="Documents",
+        dimension=DIMENSION,
+        enable_async_insert=True,
+        multi_tenant=True,
+        **kwargs,
+    )
+
+
+def rows(*ids: str) -> dict:
+    return {
+        "vectors": np.ones((len(ids), DIMENSION), dtype=np.float32),
+        "metadata": [VectorMetadata(text=idx) for idx in ids],
+        "ids": list(ids),
+    }
+
+
+async def test_coalesces_upserts_into_one_batch_per_tenant(client):
+    store = make_store(async_insert_wait_ms=50)
+    
+    results = await asyncio.gather(
+        store.upsert(**rows("a1"), tenant="a"),
+        store.upsert(**rows("b1", "b2"), tenant="b"),
+        store.upsert(**rows("a2"), tenant="a"),
+    )
+    
+    assert results == [1, 2, 1]
+    assert sorted(client.writes) == [("a", ["a1", "a2"]), ("b", ["b1", "b2"])]
+    await store.close()
+
+
+async def test_failed_batch_fails_every_coalesced_upsert(client):
+    client.failing_tenants.add("a")
+    store = make_store(async_insert_wait_ms=50)
+    
+    results = await asyncio.gather(
+        store.upsert(**rows("a1"), tenant="a"),
+        store.upsert(**rows("a2"), tenant="a"),
+        store.upsert(**rows("b1"), tenant="b"),
+        return_exceptions=True,
+    )
+    
+    assert isinstance(results[0], VectorDBError)
+    assert isinstance(results[1], VectorDBError)
+    # Other tenants' batches are unaffected
+    assert results[2] == 1
+    assert client.writes == [("b", ["b1"])]
+    await store.close()
+
+
+async def test_cancelled_worker_fails_in_flight_and_queued_upserts(client):
+    store = make_store(async_insert_max_rows=1)
+    client.gate.clear()
+    try:
+        in_flight = asyncio.create_task(store.upsert(**rows("a1"), tenant="a"))
+        assert await asyncio.to_thread(client.entered.wait, 5)
+        queued = asyncio.create_task(store.upsert(**rows("a2"), tenant="a"))
+        await asyncio.sleep(0)
+        
+        store._insert_task.cancel()
+        
+        for task in (in_flight, queued):
+            with pytest.raises(RuntimeError, match="insert queue stopped"):
+                await asyncio.wait_for(task, 5)
+        assert store._insert_queue.empty()
+    finally:
+        client.gate.set()
+    
+    # Nothing is left for close() to wait on
+    await asyncio.wait_for(store.close(), 5)